@@ -6,29 +6,54 @@ Initializes Prisma database schema and generates client code
 for the Westminster Parliamentary AI System.
 """
 
+import asyncio
 import subprocess
 import sys
 import os
 from pathlib import Path
+from typing import List
 
 
-def run_command(command: str, description: str) -> bool:
-    """Run a shell command and return success status."""
-    print(f"📋 {description}...")
+def run_command(command: List[str], description: str) -> bool:
+    """Run a command (argv list, no shell) and return success status.
+    
+    Output is streamed straight to the parent's stdout/stderr rather than
+    captured, so a failing step has already printed its own diagnostics.
+    """
+    print(f"📋 {description}...", flush=True)
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        subprocess.run(command, check=True)
         print(f"✅ {description} completed")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed:")
-        print(f"   Command: {command}")
-        print(f"   Error: {e.stderr}")
+        print(f"   Command: {' '.join(command)}")
+        print(f"   Exit code: {e.returncode}")
+        return False
+    except OSError as e:
+        print(f"❌ {description} failed:")
+        print(f"   Command: {' '.join(command)}")
+        print(f"   Error: {e}")
+        return False
+
+
+def test_database_connection() -> bool:
+    """Connect with the generated Prisma client in-process and report status."""
+    description = "Test database connection"
+    print(f"📋 {description}...")
+    
+    async def _probe():
+        from triad.database.prisma_client import prisma_client
+        await prisma_client.connect()
+        await prisma_client.disconnect()
+    
+    try:
+        asyncio.run(_probe())
+        print(f"✅ {description} completed")
+        return True
+    except Exception as e:
+        print(f"❌ {description} failed:")
+        print(f"   Error: {e}")
         return False
 
 
@@ -39,6 +64,7 @@ def main():
     # Check if we're in the right directory
     project_root = Path(__file__).parent.parent
     os.chdir(project_root)
+    sys.path.insert(0, str(project_root))
     
     # Set default database URL if not provided
     db_url = os.getenv("DATABASE_URL", "file:./data/triad.db")
@@ -49,14 +75,15 @@ def main():
     
     # Create data directory for SQLite
     if "file:" in db_url:
-        data_dir = project_root / "data"
-        data_dir.mkdir(exist_ok=True)
-        print(f"📁 Created data directory: {data_dir}")
+        data_dir = os.path.join(project_root, "data")
+        if not os.path.isdir(data_dir):
+            os.makedirs(data_dir, exist_ok=True)
+            print(f"📁 Created data directory: {data_dir}")
     
     # Setup steps
     steps = [
-        ("prisma generate", "Generate Prisma client"),
-        ("prisma db push", "Push schema to database"),
+        (["prisma", "generate"], "Generate Prisma client"),
+        (["prisma", "db", "push"], "Push schema to database"),
     ]
     
     all_success = True
@@ -74,7 +101,7 @@ def main():
         print("   3. Check constitutional status: http://localhost:8000/api/v1/parliamentary/constitutional-status")
         
         # Create initial agents if database is empty
-        if run_command("python -c \"from triad.database.prisma_client import prisma_client; import asyncio; asyncio.run(prisma_client.connect()); print('Database connected')\"", "Test database connection"):
+        if test_database_connection():
             print("\n🏛️  Database ready for Westminster Parliamentary AI System!")
         
         return 0
@@ -12,7 +12,7 @@ import os
 from pathlib import Path
 import argparse
 import signal
-from typing import Optional
+from typing import Optional, Dict, Any
 
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -21,6 +21,13 @@ import logfire
 from triad.core.config import load_config, ConfigurationError
 from triad.core.constitutional import ConstitutionalFramework
 
+# Compliance check applied to the core agents at startup
+_COMPLIANCE_REQUEST = {
+    "agents": ("planner_agent", "executor_agent", "evaluator_agent", "overwatch_agent"),
+    "parliamentary_procedures": True,
+    "separation_of_powers": True
+}
+
 
 class TriadModelServer:
     """
@@ -35,6 +42,8 @@ class TriadModelServer:
         self.config = None
         self.constitutional_framework = None
         self.server_process = None
+        self._shutdown_task: Optional[asyncio.Task] = None
+        self._last_compliance: Optional[Dict[str, Any]] = None
         
     async def initialize(self):
         """Initialize the Triad Model system."""
@@ -56,11 +65,8 @@ class TriadModelServer:
             })
             
             # Validate constitutional compliance
-            compliance = self.constitutional_framework.validate_compliance({
-                "agents": ["planner_agent", "executor_agent", "evaluator_agent", "overwatch_agent"],
-                "parliamentary_procedures": True,
-                "separation_of_powers": True
-            })
+            compliance = self.constitutional_framework.validate_compliance(_COMPLIANCE_REQUEST)
+            self._last_compliance = compliance
             
             if not compliance["constitutional_compliant"]:
                 raise ConfigurationError(f"Constitutional compliance failure: {compliance['violations']}")
@@ -76,6 +82,10 @@ class TriadModelServer:
             logfire.error("Failed to initialize Triad Model", error=str(e))
             raise
     
+    def get_compliance(self) -> Optional[Dict[str, Any]]:
+        """Return the compliance result validated during ``initialize()``."""
+        return self._last_compliance
+    
     async def start_server(self):
         """Start the FastAPI server."""
         import uvicorn
@@ -99,8 +109,8 @@ class TriadModelServer:
             )
             
             # Start server
-            server = uvicorn.Server(uvicorn_config)
-            await server.serve()
+            self.server_process = uvicorn.Server(uvicorn_config)
+            await self.server_process.serve()
             
         except Exception as e:
             logfire.error("Failed to start server", error=str(e))
@@ -121,14 +131,30 @@ class TriadModelServer:
             logfire.error("Error during shutdown", error=str(e))
     
     def setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
-            logfire.info("Received shutdown signal", signal=signum)
-            asyncio.create_task(self.shutdown())
-            sys.exit(0)
+        """Setup signal handlers for graceful shutdown.
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        Handlers are registered on the running event loop so shutdown is
+        scheduled as a task on that loop. Windows loops lack
+        ``add_signal_handler``, so ``signal.signal`` remains the fallback.
+        """
+        loop = asyncio.get_running_loop()
+        
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._handle_shutdown_signal, sig)
+            except NotImplementedError:
+                signal.signal(
+                    sig,
+                    lambda signum, frame: loop.call_soon_threadsafe(self._handle_shutdown_signal, signum)
+                )
+    
+    def _handle_shutdown_signal(self, signum: int):
+        """Stop the API server and schedule framework shutdown on the loop."""
+        logfire.info("Received shutdown signal", signal=signum)
+        if self.server_process is not None:
+            self.server_process.should_exit = True
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.get_running_loop().create_task(self.shutdown())
 
 
 async def main():
@@ -157,6 +183,17 @@ async def main():
     
     args = parser.parse_args()
     
+    # Configuration check mode only needs the configuration to load
+    if args.check_config:
+        environment = args.environment or os.getenv("TRIAD_ENV", "development")
+        try:
+            load_config(environment)
+        except ConfigurationError as e:
+            print(f"❌ Configuration Error: {e}")
+            return 1
+        print(f"✅ Configuration valid for environment: {environment}")
+        return 0
+    
     # Configure Logfire
     logfire.configure(
         service_name="triad-model-startup",
@@ -168,19 +205,9 @@ async def main():
         server = TriadModelServer(args.environment)
         await server.initialize()
         
-        # Configuration check mode
-        if args.check_config:
-            logfire.info("Configuration check passed", environment=server.environment)
-            print(f"✅ Configuration valid for environment: {server.environment}")
-            return 0
-        
         # Constitutional compliance check mode
         if args.constitutional_check:
-            compliance = server.constitutional_framework.validate_compliance({
-                "agents": ["planner_agent", "executor_agent", "evaluator_agent", "overwatch_agent"],
-                "parliamentary_procedures": True,
-                "separation_of_powers": True
-            })
+            compliance = server.get_compliance()
             
             if compliance["constitutional_compliant"]:
                 print("✅ Constitutional compliance check passed")
@@ -225,4 +252,13 @@ async def main():
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
\ No newline at end of file
+    # Use uvloop's event loop when available (installed with uvicorn[standard])
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+    
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        sys.exit(runner.run(main()))
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""Tests for A2ABrokerCore message dispatch."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from triad.a2a.broker_core import CONVERSATION_MESSAGE, A2ABrokerCore
+from triad.a2a.models import ConversationContext, MessageType, TaskRequest
+
+
+class FakeStorage:
+    """In-memory stand-in for A2AStorage."""
+
+    def __init__(self):
+        self.task_requests: Dict[str, TaskRequest] = {}
+        self.task_responses: List[Any] = []
+        self.conversations: List[ConversationContext] = []
+
+    async def store_task_request(self, request: TaskRequest) -> None:
+        self.task_requests[request.request_id] = request
+
+    async def get_task_request(self, request_id: str) -> Optional[TaskRequest]:
+        return self.task_requests.get(request_id)
+
+    async def store_task_response(self, response: Any) -> None:
+        self.task_responses.append(response)
+
+    async def store_conversation_context(self, context: ConversationContext) -> None:
+        self.conversations.append(context)
+
+
+class RecordingLogger:
+    """Async logger that records every call."""
+
+    def __init__(self):
+        self.records: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    def __getattr__(self, level: str):
+        async def log(event: str, **attributes: Any) -> None:
+            self.records.append((level, event, attributes))
+        return log
+
+
+@pytest.fixture
+async def broker():
+    broker = A2ABrokerCore(FakeStorage(), RecordingLogger())
+    await broker.initialize()
+    yield broker
+    await broker.close()
+
+
+async def test_invalid_task_request_returns_error(broker):
+    message = {"task_type": "planning"}
+
+    result = await broker.dispatch_message(MessageType.TASK_REQUEST, message)
+
+    assert result["success"] is False
+    assert "error" in result
+
+    await broker.close()
+    assert any(
+        level == "error" and event == "Task request handling failed" and attrs["message"] is message
+        for level, event, attrs in broker.logfire_logger.records
+    )
+
+
+async def test_task_response_is_routed_to_requester(broker):
+    request = await broker.dispatch_message(MessageType.TASK_REQUEST, {
+        "requesting_agent": "planner_agent",
+        "target_agent": "executor_agent",
+        "task_type": "execution",
+        "task_description": "Implement the approved plan"
+    })
+    assert request["success"] is True
+    (request_id,) = broker.storage.task_requests
+
+    response = await broker.dispatch_message(MessageType.TASK_RESPONSE, {
+        "request_id": request_id,
+        "responding_agent": "executor_agent",
+        "status": "completed"
+    })
+
+    assert response["success"] is True
+    assert len(broker.storage.task_responses) == 1
+    routed = broker.agent_queues["planner_agent"].dequeue()
+    assert routed.kind is MessageType.TASK_RESPONSE
+    assert routed.source == "executor_agent"
+    assert routed.payload["request_id"] == request_id
+
+
+async def test_task_response_for_unknown_request_returns_error(broker):
+    response = await broker.dispatch_message(MessageType.TASK_RESPONSE, {
+        "request_id": "req_missing",
+        "responding_agent": "executor_agent",
+        "status": "completed"
+    })
+
+    assert response["success"] is False
+    assert broker.storage.task_responses == []
+
+
+async def test_conversation_message_is_routed_to_other_participants(broker):
+    context = ConversationContext(
+        conversation_type="collective_decision",
+        participants=["planner_agent", "executor_agent", "evaluator_agent"],
+        initiated_by="planner_agent"
+    )
+    broker.active_conversations[context.context_id] = context
+
+    result = await broker.dispatch_message(CONVERSATION_MESSAGE, {
+        "conversation_id": context.context_id,
+        "source_agent": "planner_agent",
+        "content": "Proposal ready for review"
+    })
+
+    assert result == {"success": True, "conversation_id": context.context_id}
+    assert context.message_count == 1
+    assert broker.storage.conversations == [context]
+    assert broker.agent_queues["planner_agent"].current_size() == 0
+    for participant in ("executor_agent", "evaluator_agent"):
+        routed = broker.agent_queues[participant].dequeue()
+        assert routed.conversation_id == context.context_id
+        assert routed.source == "planner_agent"
+
+    status = await broker.get_conversation_status(context.context_id)
+    assert status["message_count"] == 1
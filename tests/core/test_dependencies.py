@@ -0,0 +1,65 @@
+"""Tests for TriadDeps background record writing."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+from triad.core.dependencies import TriadConfig, TriadDeps
+
+
+class SyncLogger:
+    """Logger with synchronous methods, like the logfire module."""
+
+    def __init__(self):
+        self.records: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    def __getattr__(self, level: str):
+        def log(event: str, **attributes: Any) -> None:
+            self.records.append((level, event, attributes))
+        return log
+
+
+def make_deps(logger: Any) -> TriadDeps:
+    return TriadDeps(
+        db_session=None,
+        mcp_client=None,
+        a2a_broker=None,
+        logfire_logger=logger,
+        parliamentary_procedure=None,
+        constitutional_crisis_manager_factory=lambda: None,
+        crown_prerogative_factory=lambda: None,
+        constitutional_framework=SimpleNamespace(session_epoch=0, current_session=None),
+        config=TriadConfig()
+    )
+
+
+async def test_record_flusher_keeps_draining_after_failed_batch(monkeypatch):
+    written: List[List[dict]] = []
+    release_first = asyncio.Event()
+    calls = 0
+
+    async def write(self, records):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await release_first.wait()
+            raise RuntimeError("insert failed")
+        written.append(records)
+
+    monkeypatch.setattr(TriadDeps, "_write_constitutional_records", write)
+    logger = SyncLogger()
+    deps = make_deps(logger)
+
+    # The second record is queued while the first batch is still being written
+    await deps.log_constitutional_record("first", {"agent": "planner_agent"})
+    await asyncio.sleep(0)
+    await deps.log_constitutional_record("second", {"agent": "planner_agent"})
+    release_first.set()
+    async with asyncio.timeout(5):
+        await deps.flush_constitutional_records()
+
+    assert [record["event_type"] for batch in written for record in batch] == ["second"]
+    assert logger.records == [
+        ("error", "Constitutional record batch write failed", {"error": "insert failed", "records": 1})
+    ]
+    deps._record_flusher.cancel()
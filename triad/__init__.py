@@ -11,19 +11,42 @@ __version__ = "2.0.0"
 __author__ = "AI Triad Model Team"
 __email__ = "contact@ai-triad-model.org"
 
+import importlib
+
 # Initialize Logfire for observability before importing components
 from .core.logging.logfire_config import initialize_logfire
 _logfire_initialized = initialize_logfire()
 
-from .core.framework import TriadFramework
-from .core.dependencies import TriadDeps
-from .agents.roles.planner import PlannerAgent
-from .agents.roles.executor import ExecutorAgent
-from .agents.roles.evaluator import EvaluatorAgent
-from .agents.roles.overwatch import OverwatchAgent
-from .core.procedures import SystemProcedures
-from .core.crisis import SystemCrisisManager
-from .core.oversight import SystemOversight
+# Public components are imported lazily (PEP 562) so that ``import triad``
+# does not pull in pydantic_ai, SQLAlchemy and the agent stack up front.
+_LAZY_IMPORTS = {
+    "TriadFramework": (".core.framework", "TriadFramework"),
+    "TriadDeps": (".core.dependencies", "TriadDeps"),
+    "PlannerAgent": (".agents.roles.planner", "PlannerAgent"),
+    "ExecutorAgent": (".agents.roles.executor", "ExecutorAgent"),
+    "EvaluatorAgent": (".agents.roles.evaluator", "EvaluatorAgent"),
+    "OverwatchAgent": (".agents.roles.overwatch", "OverwatchAgent"),
+    "SystemProcedures": (".core.procedures", "SystemProcedures"),
+    "SystemCrisisManager": (".core.crisis", "SystemCrisisManager"),
+    "SystemOversight": (".core.oversight", "SystemOversight"),
+}
+
+
+def __getattr__(name: str):
+    """Resolve public components on first access and cache them on the module."""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "__version__",
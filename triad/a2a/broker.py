@@ -5,9 +5,16 @@ Central broker for agent-to-agent communication with constitutional oversight
 and Westminster parliamentary principles.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, ContextManager, Tuple, Callable, Awaitable
+from contextlib import nullcontext
+from types import MappingProxyType
 from datetime import datetime, timezone
-import uuid
+import asyncio
+import functools
+import itertools
+import json
+import random
+import secrets
 import logfire
 
 from .models import (
@@ -17,6 +24,85 @@ from .models import (
 from .storage import A2AStorage
 
 
+# Fields stamped on every parliamentary record entry written by the broker
+_AUDIT_BASE = MappingProxyType({
+    "recorded_by": "a2a_broker",
+    "constitutional_oversight": True
+})
+
+# Task types each agent may request on its own constitutional authority
+_AGENT_AUTHORITY = {
+    "planner_agent": ("planning", "policy", "legislation"),
+    "executor_agent": ("execution", "implementation", "operation"),
+    "evaluator_agent": ("validation", "compliance", "review"),
+    "overwatch_agent": ("monitoring", "oversight", "emergency")
+}
+
+# Task types any agent may request
+_UNIVERSAL_TASKS = ("communication", "status", "query")
+
+# Authority as bitmasks: each known task type owns one bit, and an agent's
+# mask has the bits of every task type it may request
+_TASK_BITS = {
+    task_type: 1 << bit
+    for bit, task_type in enumerate(
+        _UNIVERSAL_TASKS + tuple(t for tasks in _AGENT_AUTHORITY.values() for t in tasks)
+    )
+}
+_UNIVERSAL_MASK = sum(_TASK_BITS[task_type] for task_type in _UNIVERSAL_TASKS)
+_AGENT_TASK_MASKS = {
+    agent: _UNIVERSAL_MASK | sum(_TASK_BITS[task_type] for task_type in tasks)
+    for agent, tasks in _AGENT_AUTHORITY.items()
+}
+
+# Separation of powers violations keyed by (requesting agent, target agent, task type)
+_POWER_SEPARATION_VIOLATIONS = {
+    (requesting_agent, "evaluator_agent", task_type): "Cannot override judicial decisions"
+    for requesting_agent in ("planner_agent", "executor_agent")
+    for task_type in ("override", "ignore")
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _check_authority(
+    requesting_agent: str,
+    target_agent: str,
+    task_type: str
+) -> Tuple[bool, Tuple[str, ...]]:
+    """Check an agent's authority for a task; pure, so results are memoized."""
+    violations = []
+    
+    # Check agent authority mapping
+    allowed_mask = _AGENT_TASK_MASKS.get(requesting_agent, _UNIVERSAL_MASK)
+    
+    if not allowed_mask & _TASK_BITS.get(task_type, 0):
+        violations.append(f"Agent {requesting_agent} lacks authority for task type {task_type}")
+    
+    # Check separation of powers (legislative directing executive and
+    # executive requesting judicial review are always permitted)
+    separation_violation = _POWER_SEPARATION_VIOLATIONS.get(
+        (requesting_agent, target_agent, task_type)
+    )
+    if separation_violation:
+        violations.append(separation_violation)
+    
+    return not violations, tuple(violations)
+
+
+MessageHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+async def _noop_handler(message: Dict[str, Any]) -> None:
+    """Default handler for message types with no registered handler."""
+    return None
+
+
+def _splice_json(envelope: Dict[str, Any], key: str, payload_json: str) -> str:
+    """Serialize ``envelope`` with an already-serialized JSON value added under ``key``."""
+    head = json.dumps(envelope)
+    return f"{head[:-1]}, {json.dumps(key)}: {payload_json}}}"
+
+
 class A2ABroker:
     """
     Central broker for agent-to-agent communication.
@@ -25,27 +111,104 @@ class A2ABroker:
     and parliamentary accountability for all inter-agent communication.
     """
     
-    def __init__(self, storage: A2AStorage, logfire_logger: logfire):
+    __slots__ = (
+        "storage",
+        "logfire_logger",
+        "span_sample_rate",
+        "persist_status_broadcasts",
+        "_store_queued_batch",
+        "_store_parliamentary_batch",
+        "active_conversations",
+        "agent_queues",
+        "message_handlers",
+        "constitutional_monitor_active",
+        "_pending_writes",
+        "_flush_scheduled",
+        "_flush_task",
+        "_pending_audit",
+        "_id_prefix",
+        "_msg_counter",
+        "_broadcast_counter",
+        "_ts_cache",
+        "_last_status",
+    )
+    
+    # Core agents and their message queue capacity
+    _CORE_AGENTS = (
+        ("planner_agent", 100),
+        ("executor_agent", 100),
+        ("evaluator_agent", 100),
+        ("overwatch_agent", 200)
+    )
+    
+    def __init__(
+        self,
+        storage: A2AStorage,
+        logfire_logger: logfire,
+        span_sample_rate: float = 0.1,
+        persist_status_broadcasts: bool = False
+    ):
         self.storage = storage
         self.logfire_logger = logfire_logger
+        
+        # Whether routine status update broadcasts are stored
+        self.persist_status_broadcasts = persist_status_broadcasts
+        
+        # Fraction of broker operations traced with a Logfire span
+        self.span_sample_rate = span_sample_rate
+        
+        # Storage methods used on every routed message or audit entry
+        self._store_queued_batch = storage.store_queued_messages_batch
+        self._store_parliamentary_batch = storage.store_parliamentary_records_batch
         self.active_conversations: Dict[str, ConversationContext] = {}
         self.agent_queues: Dict[str, MessageQueue] = {}
-        self.message_handlers: Dict[str, callable] = {}
+        self.message_handlers: Dict[str, MessageHandler] = {}
         self.constitutional_monitor_active = True
         
+        # Queued messages and parliamentary records are written in batches
+        # by a single flush task
+        self._pending_writes: List[tuple] = []
+        self._pending_audit: List[Dict[str, Any]] = []
+        self._flush_scheduled = False
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Message and broadcast IDs: random per-broker prefix plus a counter,
+        # unique across restarts without building a UUID per message
+        self._id_prefix = secrets.token_hex(4)
+        self._msg_counter = itertools.count()
+        self._broadcast_counter = itertools.count()
+        
+        # Last broadcast status per agent, so unchanged heartbeats are skipped
+        self._last_status: Dict[str, Any] = {}
+        
+        # ISO timestamp shared by everything that runs in one loop iteration
+        self._ts_cache: Optional[str] = None
+        
         # Initialize agent queues for core agents
         self._initialize_agent_queues()
     
+    def _maybe_span(self, name: str, **attributes: Any) -> ContextManager:
+        """Open a Logfire span for a sampled fraction of calls, else a no-op context."""
+        if random.random() < self.span_sample_rate:
+            return logfire.span(name, **attributes)
+        return nullcontext()
+    
+    def _now_iso(self) -> str:
+        """Current UTC time as ISO 8601, computed once per event loop iteration."""
+        if self._ts_cache is None:
+            self._ts_cache = datetime.now(timezone.utc).isoformat()
+            asyncio.get_running_loop().call_soon(self._clear_ts_cache)
+        return self._ts_cache
+    
+    def _clear_ts_cache(self) -> None:
+        self._ts_cache = None
+    
     def _initialize_agent_queues(self):
         """Initialize message queues for core agents."""
-        core_agents = ["planner_agent", "executor_agent", "evaluator_agent", "overwatch_agent"]
-        
-        for agent in core_agents:
-            self.agent_queues[agent] = MessageQueue(
-                agent_name=agent,
-                max_queue_size=200 if agent == "overwatch_agent" else 100,
-                priority_processing=True
-            )
+        self.agent_queues.update({
+            agent: MessageQueue(agent_name=agent, max_queue_size=max_size, priority_processing=True)
+            for agent, max_size in self._CORE_AGENTS
+        })
     
     async def send_task_request(
         self,
@@ -54,15 +217,23 @@ class A2ABroker:
         """
         Send task request to another agent with constitutional oversight.
         """
-        with logfire.span("a2a_task_request") as span:
-            span.set_attribute("requesting_agent", request.requesting_agent)
-            span.set_attribute("target_agent", request.target_agent)
-            span.set_attribute("priority", request.priority.value)
-            
+        with self._maybe_span(
+            "a2a_task_request",
+            requesting_agent=request.requesting_agent,
+            target_agent=request.target_agent,
+            priority=request.priority.value
+        ):
             # Constitutional validation
             if request.requires_constitutional_review():
                 constitutional_check = await self._validate_constitutional_authority(request)
                 if not constitutional_check["valid"]:
+                    await self.logfire_logger.warning(
+                        "A2A task request rejected",
+                        request_id=request.request_id,
+                        requesting_agent=request.requesting_agent,
+                        target_agent=request.target_agent,
+                        violations=constitutional_check["violations"]
+                    )
                     return {
                         "success": False,
                         "error": "Constitutional authority validation failed",
@@ -73,15 +244,15 @@ class A2ABroker:
             await self.storage.store_task_request(request)
             
             # Route to target agent
-            routing_result = await self._route_message_to_agent(request.target_agent, {
-                "type": "task_request",
-                "request": request.model_dump(),
-                "priority": request.priority.value
-            })
+            routing_result = await self._route_message_to_agent(
+                request.target_agent,
+                {"type": "task_request", "priority": request.priority.value},
+                ("request", request.model_dump_json())
+            )
             
             # Log to parliamentary record if required
             if request.parliamentary_oversight:
-                await self._log_to_parliamentary_record(
+                self._schedule_audit(
                     "task_request_sent",
                     {
                         "request_id": request.request_id,
@@ -105,7 +276,7 @@ class A2ABroker:
             return {
                 "success": routing_result["success"],
                 "request_id": request.request_id,
-                "queued_at": datetime.now(timezone.utc).isoformat(),
+                "queued_at": self._now_iso(),
                 "parliamentary_recorded": request.parliamentary_oversight,
                 "constitutional_validated": request.requires_constitutional_review()
             }
@@ -117,13 +288,19 @@ class A2ABroker:
         """
         Send task response back to requesting agent.
         """
-        with logfire.span("a2a_task_response") as span:
-            span.set_attribute("response_id", response.response_id)
-            span.set_attribute("responding_agent", response.responding_agent)
-            
+        with self._maybe_span(
+            "a2a_task_response",
+            response_id=response.response_id,
+            responding_agent=response.responding_agent
+        ):
             # Get original request
             original_request = await self.storage.get_task_request(response.request_id)
             if not original_request:
+                await self.logfire_logger.warning(
+                    "A2A task response for unknown request",
+                    response_id=response.response_id,
+                    request_id=response.request_id
+                )
                 return {
                     "success": False,
                     "error": "Original request not found"
@@ -137,18 +314,18 @@ class A2ABroker:
             await self.storage.store_task_response(response)
             
             # Route back to requesting agent
-            routing_result = await self._route_message_to_agent(original_request.requesting_agent, {
-                "type": "task_response",
-                "response": response.model_dump(),
-                "original_request_id": response.request_id
-            })
+            routing_result = await self._route_message_to_agent(
+                original_request.requesting_agent,
+                {"type": "task_response", "original_request_id": response.request_id},
+                ("response", response.model_dump_json())
+            )
             
             # Check if validation required
             if response.validation_required:
                 await self._request_evaluator_validation(response)
             
             # Log completion
-            await self._log_to_parliamentary_record(
+            self._schedule_audit(
                 "task_response_received",
                 {
                     "response_id": response.response_id,
@@ -161,7 +338,7 @@ class A2ABroker:
             return {
                 "success": routing_result["success"],
                 "response_id": response.response_id,
-                "delivered_at": datetime.now(timezone.utc).isoformat()
+                "delivered_at": self._now_iso()
             }
     
     async def broadcast_event(
@@ -171,11 +348,13 @@ class A2ABroker:
         """
         Broadcast event to all relevant agents.
         """
-        with logfire.span("a2a_broadcast") as span:
-            broadcast_id = f"broadcast_{uuid.uuid4().hex[:8]}"
-            span.set_attribute("broadcast_id", broadcast_id)
-            span.set_attribute("event_type", event.get("event_type", "unknown"))
-            
+        broadcast_id = f"broadcast_{self._id_prefix}_{next(self._broadcast_counter):08x}"
+        
+        with self._maybe_span(
+            "a2a_broadcast",
+            broadcast_id=broadcast_id,
+            event_type=event.get("event_type", "unknown")
+        ):
             broadcast = BroadcastMessage(
                 broadcast_id=broadcast_id,
                 message_type=MessageType.STATUS_UPDATE,
@@ -192,40 +371,54 @@ class A2ABroker:
             
             delivery_results = {}
             
-            # Send to each target agent
-            for agent in target_agents:
-                try:
-                    result = await self._route_message_to_agent(agent, {
-                        "type": "broadcast",
-                        "broadcast": broadcast.model_dump(),
-                        "requires_acknowledgment": broadcast.acknowledgment_required
-                    })
-                    delivery_results[agent] = result["success"]
-                    
-                    if result["success"]:
-                        broadcast.delivered_to.append(agent)
-                        
-                except Exception as e:
+            # Send to all target agents concurrently; recipients share one
+            # payload, each wrapped in its own envelope
+            broadcast_payload = ("broadcast", broadcast.model_dump_json())
+            results = await asyncio.gather(
+                *(
+                    self._route_message_to_agent(
+                        agent,
+                        {
+                            "type": "broadcast",
+                            "requires_acknowledgment": broadcast.acknowledgment_required
+                        },
+                        broadcast_payload
+                    )
+                    for agent in target_agents
+                ),
+                return_exceptions=True
+            )
+            
+            for agent, result in zip(target_agents, results, strict=True):
+                if isinstance(result, Exception):
                     delivery_results[agent] = False
                     await self.logfire_logger.error(
                         "Broadcast delivery failed",
                         agent=agent,
-                        error=str(e)
+                        error=str(result)
                     )
+                    continue
+                
+                delivery_results[agent] = result["success"]
+                
+                if result["success"]:
+                    broadcast.delivered_to.append(agent)
             
-            # Store broadcast record
-            await self.storage.store_broadcast(broadcast)
+            # Store broadcast record (routine status updates only if configured)
+            if not event.get("ephemeral") or self.persist_status_broadcasts:
+                await self.storage.store_broadcast(broadcast)
             
-            # Log to parliamentary record
-            await self._log_to_parliamentary_record(
-                "system_broadcast",
-                {
-                    "broadcast_id": broadcast_id,
-                    "event_type": event.get("event_type"),
-                    "delivery_rate": broadcast.get_delivery_rate(),
-                    "agents_reached": len(broadcast.delivered_to)
-                }
-            )
+            # Log to parliamentary record when the event has constitutional impact
+            if broadcast.priority is not ConstitutionalPriority.ROUTINE:
+                self._schedule_audit(
+                    "system_broadcast",
+                    {
+                        "broadcast_id": broadcast_id,
+                        "event_type": event.get("event_type"),
+                        "delivery_rate": broadcast.get_delivery_rate(),
+                        "agents_reached": len(broadcast.delivered_to)
+                    }
+                )
             
             return {
                 "broadcast_id": broadcast_id,
@@ -239,13 +432,26 @@ class A2ABroker:
         self,
         status: Dict[str, Any]
     ) -> None:
-        """Broadcast status update to interested agents."""
+        """Broadcast status update to interested agents.
+        
+        An update repeating the agent's last broadcast status is skipped.
+        """
+        agent = status.get("agent", "system")
+        current = status.get("status")
+        last_status = self._last_status
+        if agent in last_status and last_status[agent] == current:
+            return
+        
         await self.broadcast_event({
             "event_type": "status_update",
-            "sender": status.get("agent", "system"),
+            "sender": agent,
             "description": f"Status update: {status.get('status', 'unknown')}",
+            "ephemeral": True,
             "data": status
         })
+        
+        # Only a delivered broadcast suppresses later repeats
+        last_status[agent] = current
     
     async def broadcast_emergency(
         self,
@@ -271,17 +477,18 @@ class A2ABroker:
         """
         Initiate multi-agent conversation with parliamentary oversight.
         """
-        with logfire.span("a2a_conversation_init") as span:
-            context = ConversationContext(
-                conversation_type=conversation_type,
-                participants=participants,
-                initiated_by=initiated_by,
-                current_topic=topic
-            )
-            
-            span.set_attribute("context_id", context.context_id)
-            span.set_attribute("participants_count", len(participants))
-            
+        context = ConversationContext(
+            conversation_type=conversation_type,
+            participants=participants,
+            initiated_by=initiated_by,
+            current_topic=topic
+        )
+        
+        with self._maybe_span(
+            "a2a_conversation_init",
+            context_id=context.context_id,
+            participants_count=len(participants)
+        ):
             # Determine constitutional oversight requirements
             if conversation_type in ["collective_decision", "constitutional_review", "crisis_management"]:
                 context.constitutional_oversight = True
@@ -290,13 +497,16 @@ class A2ABroker:
             self.active_conversations[context.context_id] = context
             
             # Notify participants
-            for participant in participants:
-                if participant != initiated_by:
-                    await self._route_message_to_agent(participant, {
-                        "type": "conversation_invitation",
-                        "context": context.model_dump(),
-                        "initiated_by": initiated_by
-                    })
+            context_payload = ("context", context.model_dump_json())
+            await asyncio.gather(*(
+                self._route_message_to_agent(
+                    participant,
+                    {"type": "conversation_invitation", "initiated_by": initiated_by},
+                    context_payload
+                )
+                for participant in participants
+                if participant != initiated_by
+            ))
             
             await self.storage.store_conversation_context(context)
             
@@ -328,22 +538,27 @@ class A2ABroker:
         context.update_activity()
         
         # Route message to participants
-        delivery_results = {}
-        for participant in context.participants:
-            if participant != message.sender_agent:
-                result = await self._route_message_to_agent(participant, {
-                    "type": "conversation_message",
-                    "message": message.model_dump(),
-                    "context_id": context_id
-                })
-                delivery_results[participant] = result["success"]
+        recipients = [p for p in context.participants if p != message.sender_agent]
+        message_payload = ("message", message.model_dump_json())
+        results = await asyncio.gather(*(
+            self._route_message_to_agent(
+                participant,
+                {"type": "conversation_message", "context_id": context_id},
+                message_payload
+            )
+            for participant in recipients
+        ))
+        delivery_results = {
+            participant: result["success"]
+            for participant, result in zip(recipients, results, strict=True)
+        }
         
         # Store message
         await self.storage.store_agent_message(message)
         
         # Log to parliamentary record if required
         if context.parliamentary_record:
-            await self._log_to_parliamentary_record(
+            self._schedule_audit(
                 "conversation_message",
                 {
                     "context_id": context_id,
@@ -359,6 +574,18 @@ class A2ABroker:
             "message_id": message.message_id
         }
     
+    def register_handler(self, message_type: str, handler: MessageHandler) -> None:
+        """Register the handler for a message type, replacing any existing one."""
+        self.message_handlers[message_type] = handler
+    
+    def unregister_handler(self, message_type: str) -> None:
+        """Remove the handler for a message type, if one is registered."""
+        self.message_handlers.pop(message_type, None)
+    
+    async def dispatch_message(self, message_type: str, message: Dict[str, Any]) -> Any:
+        """Dispatch a message to its registered handler (no-op if none)."""
+        return await self.message_handlers.get(message_type, _noop_handler)(message)
+    
     async def register_cache_coordination(
         self,
         config: Dict[str, Any]
@@ -378,19 +605,23 @@ class A2ABroker:
     async def _route_message_to_agent(
         self,
         agent_name: str,
-        message: Dict[str, Any]
+        message: Dict[str, Any],
+        payload: Optional[Tuple[str, str]] = None
     ) -> Dict[str, Any]:
         """
         Route message to specific agent queue.
+        
+        ``payload`` is an optional ``(key, json)`` pair holding a model that
+        was already serialized with ``model_dump_json``; it is spliced into
+        the stored message under ``key`` without a dict round trip.
         """
-        if agent_name not in self.agent_queues:
+        queue = self.agent_queues.get(agent_name)
+        if queue is None:
             return {
                 "success": False,
                 "error": f"Agent {agent_name} not found"
             }
         
-        queue = self.agent_queues[agent_name]
-        
         # Check if queue is full
         if queue.is_full():
             return {
@@ -399,21 +630,74 @@ class A2ABroker:
             }
         
         # Generate message ID and add to queue
-        message_id = f"msg_{uuid.uuid4().hex[:8]}"
+        message_id = f"msg_{self._id_prefix}_{next(self._msg_counter):08x}"
         message["message_id"] = message_id
-        message["queued_at"] = datetime.now(timezone.utc).isoformat()
+        message["queued_at"] = self._now_iso()
         
-        queue.pending_messages.append(message_id)
+        queue_position = queue.enqueue(message_id)
         
         # Store message for retrieval
-        await self.storage.store_queued_message(message_id, message)
+        self._schedule_queued_write(
+            message_id,
+            message,
+            _splice_json(message, *payload) if payload else None
+        )
         
         return {
             "success": True,
             "message_id": message_id,
-            "queue_position": len(queue.pending_messages)
+            "queue_position": queue_position
         }
     
+    def _schedule_queued_write(
+        self,
+        message_id: str,
+        message: Dict[str, Any],
+        message_json: Optional[str] = None
+    ) -> None:
+        """Queue a message (and its JSON, if prebuilt) for the next batched storage write."""
+        self._pending_writes.append((message_id, message, message_json))
+        self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        """Start the flush task unless one is already pending."""
+        if not self._flush_scheduled:
+            # The flush task first runs on the next loop iteration, so every
+            # message routed in the current burst lands in the same batch
+            self._flush_scheduled = True
+            self._flush_task = asyncio.create_task(self._flush_queued_writes())
+    
+    async def _flush_queued_writes(self) -> None:
+        """Write pending queued messages and parliamentary records until none are left."""
+        while self._pending_writes or self._pending_audit:
+            if self._pending_writes:
+                batch = self._pending_writes
+                self._pending_writes = []
+                
+                try:
+                    await self._store_queued_batch(batch)
+                except Exception as e:
+                    await self.logfire_logger.error(
+                        "Queued message batch write failed",
+                        messages=len(batch),
+                        error=str(e)
+                    )
+            
+            if self._pending_audit:
+                entries = self._pending_audit
+                self._pending_audit = []
+                
+                try:
+                    await self._store_parliamentary_batch(entries)
+                except Exception as e:
+                    await self.logfire_logger.error(
+                        "Parliamentary record batch write failed",
+                        records=len(entries),
+                        error=str(e)
+                    )
+        
+        self._flush_scheduled = False
+    
     async def _validate_constitutional_authority(
         self,
         request: TaskRequest
@@ -421,59 +705,28 @@ class A2ABroker:
         """
         Validate constitutional authority for task request.
         """
-        violations = []
-        
-        # Check agent authority mapping
-        authority_map = {
-            "planner_agent": ["planning", "policy", "legislation"],
-            "executor_agent": ["execution", "implementation", "operation"],  
-            "evaluator_agent": ["validation", "compliance", "review"],
-            "overwatch_agent": ["monitoring", "oversight", "emergency"]
-        }
-        
-        allowed_tasks = authority_map.get(request.requesting_agent, [])
-        
-        if request.task_type not in allowed_tasks and request.task_type not in ["communication", "status", "query"]:
-            violations.append(f"Agent {request.requesting_agent} lacks authority for task type {request.task_type}")
-        
-        # Check separation of powers
-        if (request.requesting_agent == "planner_agent" and 
-            request.target_agent == "executor_agent" and 
-            request.task_type == "execution"):
-            # This is allowed - legislative directing executive
-            pass
-        elif (request.requesting_agent == "executor_agent" and 
-              request.target_agent == "evaluator_agent" and 
-              request.task_type == "validation"):
-            # This is allowed - executive requesting judicial review
-            pass
-        else:
-            # Check for potential violations
-            if (request.requesting_agent in ["planner_agent", "executor_agent"] and 
-                request.target_agent == "evaluator_agent" and 
-                request.task_type in ["override", "ignore"]):
-                violations.append("Cannot override judicial decisions")
+        valid, violations = _check_authority(
+            request.requesting_agent, request.target_agent, request.task_type
+        )
         
         return {
-            "valid": len(violations) == 0,
-            "violations": violations
+            "valid": valid,
+            "violations": list(violations)
         }
     
-    async def _log_to_parliamentary_record(
+    def _schedule_audit(
         self,
         event_type: str,
         data: Dict[str, Any]
     ) -> None:
-        """Log event to parliamentary record (Hansard)."""
-        parliamentary_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+        """Queue a parliamentary record (Hansard) entry for the next batched storage write."""
+        self._pending_audit.append({
+            "timestamp": self._now_iso(),
             "event_type": event_type,
             "data": data,
-            "recorded_by": "a2a_broker",
-            "constitutional_oversight": True
-        }
-        
-        await self.storage.store_parliamentary_record(parliamentary_entry)
+            **_AUDIT_BASE
+        })
+        self._schedule_flush()
     
     async def _notify_crown_of_request(
         self,
@@ -490,7 +743,7 @@ class A2ABroker:
                 "priority": request.priority.value,
                 "constitutional_authority_required": request.constitutional_authority_required
             },
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": self._now_iso()
         }
         
         await self._route_message_to_agent("overwatch_agent", crown_notification)
@@ -505,7 +758,7 @@ class A2ABroker:
             "response_id": response.response_id,
             "responding_agent": response.responding_agent,
             "responsibility_declined": True,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": self._now_iso()
         }
         
         # Notify Crown of ministerial responsibility issue
@@ -537,10 +790,10 @@ class A2ABroker:
         agent_name: str
     ) -> Optional[Dict[str, Any]]:
         """Get status of agent's message queue."""
-        if agent_name not in self.agent_queues:
+        queue = self.agent_queues.get(agent_name)
+        if queue is None:
             return None
         
-        queue = self.agent_queues[agent_name]
         return queue.get_queue_health()
     
     async def get_conversation_status(
@@ -563,9 +816,14 @@ class A2ABroker:
     
     async def close(self) -> None:
         """Clean shutdown of A2A broker."""
+        # Finish any batched queue and parliamentary record writes
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        
         # Store final state
-        for context in self.active_conversations.values():
-            await self.storage.store_conversation_context(context)
+        await self.storage.store_conversation_contexts_bulk(
+            list(self.active_conversations.values())
+        )
         
         # Clear active conversations
         self.active_conversations.clear()
@@ -5,8 +5,12 @@ Core broker functionality for agent-to-agent communication with
 governance oversight and organizational accountability.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Type, TypeVar, Callable, Awaitable
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
+import asyncio
+import inspect
 import uuid
 import logfire
 
@@ -17,6 +21,46 @@ from .models import (
 from .storage import A2AStorage
 
 
+# Handler signature: (message, trusted) -> result
+CoreMessageHandler = Callable[[Dict[str, Any], bool], Awaitable[Dict[str, Any]]]
+
+# Dispatch keys for message shapes rather than types: a BroadcastMessage may
+# carry any MessageType, and conversation messages have none of their own
+BROADCAST_MESSAGE = "broadcast"
+CONVERSATION_MESSAGE = "conversation"
+
+_Model = TypeVar("_Model", TaskRequest, TaskResponse, AgentMessage, BroadcastMessage)
+
+
+def _parse_message(model: Type[_Model], message: Dict[str, Any], trusted: bool) -> _Model:
+    """
+    Build a model from an incoming message dict.
+    
+    Messages from trusted internal producers were validated when they were
+    created, so they are constructed without re-validation; everything else
+    is validated in full.
+    """
+    if trusted:
+        return model.model_construct(**message)
+    return model.model_validate(message)
+
+
+@dataclass(slots=True)
+class RoutedMessage:
+    """Envelope for a message waiting in an agent queue."""
+    kind: Optional[MessageType]
+    payload: Dict[str, Any]
+    source: Optional[str]
+    target: str
+    conversation_id: Optional[str]
+    queued_at: str
+
+
+def _err(error: Any) -> Dict[str, Any]:
+    """Failure result for a handler or route."""
+    return {"success": False, "error": str(error)}
+
+
 class A2ABrokerCore:
     """
     Core broker for agent-to-agent communication.
@@ -25,27 +69,111 @@ class A2ABrokerCore:
     and organizational accountability for all inter-agent communication.
     """
     
-    def __init__(self, storage: A2AStorage, logfire_logger: logfire):
+    # Core agents and their message queue capacity
+    _CORE_AGENTS = (
+        ("planner_agent", 100),
+        ("executor_agent", 100),
+        ("evaluator_agent", 100),
+        ("overwatch_agent", 200)
+    )
+    
+    # Buffered log records kept before the oldest are dropped
+    _LOG_BUFFER_SIZE = 8192
+    
+    # Log records emitted per drain pass
+    _LOG_BATCH_MAX = 256
+    
+    def __init__(
+        self,
+        storage: A2AStorage,
+        logfire_logger: logfire,
+        debug_logging: bool = False
+    ):
         self.storage = storage
         self.logfire_logger = logfire_logger
+        self._debug_enabled = debug_logging
         self.active_conversations: Dict[str, ConversationContext] = {}
         self.agent_queues: Dict[str, MessageQueue] = {}
-        self.message_handlers: Dict[str, callable] = {}
+        self._all_agents: tuple = ()
+        self.message_handlers: Dict[str, CoreMessageHandler] = {}
         self.governance_monitor_active = True
         
+        # Per-iteration timestamp cache, see _now()
+        self._ts_cache: Optional[tuple] = None
+        
+        # Hot-path log records, emitted by a background drain task
+        self._log_buffer: deque = deque(maxlen=self._LOG_BUFFER_SIZE)
+        self._log_ready = asyncio.Event()
+        self._log_task: Optional[asyncio.Task] = None
+        self.failed_log_records = 0
+        
         # Initialize agent queues for core agents
         self._initialize_agent_queues()
     
+    def _now(self) -> datetime:
+        """Current UTC time, computed once per event loop iteration."""
+        return self._timestamp()[0]
+    
+    def _now_iso(self) -> str:
+        """Current UTC time as ISO 8601, computed once per event loop iteration."""
+        return self._timestamp()[1]
+    
+    def _timestamp(self) -> tuple:
+        if self._ts_cache is None:
+            now = datetime.now(timezone.utc)
+            self._ts_cache = (now, now.isoformat())
+            asyncio.get_running_loop().call_soon(self._clear_ts_cache)
+        return self._ts_cache
+    
+    def _clear_ts_cache(self) -> None:
+        self._ts_cache = None
+    
+    def _log(self, level: str, event: str, **attributes: Any) -> None:
+        """
+        Buffer a log record for the drain task instead of awaiting the logger.
+        
+        The drain task is started on the first record, so records are emitted
+        whether or not ``initialize()`` has run.
+        """
+        self._log_buffer.append((level, event, attributes))
+        self._log_ready.set()
+        
+        if self._log_task is None or self._log_task.done():
+            self._log_task = asyncio.get_running_loop().create_task(self._drain_logs())
+    
+    async def _emit_log(self, level: str, event: str, attributes: Dict[str, Any]) -> None:
+        """Emit one record; a failing logger only loses that record."""
+        try:
+            result = getattr(self.logfire_logger, level)(event, **attributes)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            self.failed_log_records += 1
+    
+    async def _emit_logs(self) -> None:
+        """Emit buffered log records in batches until the buffer is empty."""
+        buffer = self._log_buffer
+        while buffer:
+            batch = [buffer.popleft() for _ in range(min(len(buffer), self._LOG_BATCH_MAX))]
+            await asyncio.gather(*(
+                self._emit_log(level, event, attributes)
+                for level, event, attributes in batch
+            ))
+    
+    async def _drain_logs(self) -> None:
+        """Background task emitting buffered log records as they arrive."""
+        while True:
+            await self._log_ready.wait()
+            self._log_ready.clear()
+            await self._emit_logs()
+    
     def _initialize_agent_queues(self):
         """Initialize message queues for core agents."""
-        core_agents = ["planner_agent", "executor_agent", "evaluator_agent", "overwatch_agent"]
-        
-        for agent in core_agents:
-            self.agent_queues[agent] = MessageQueue(
-                agent_name=agent,
-                max_queue_size=200 if agent == "overwatch_agent" else 100,
-                priority_processing=True
-            )
+        self.agent_queues.update({
+            agent: MessageQueue(agent_name=agent, max_queue_size=max_size, priority_processing=True)
+            for agent, max_size in self._CORE_AGENTS
+        })
+        self._all_agents = tuple(self.agent_queues)
     
     async def initialize(self) -> None:
         """Initialize the broker with governance settings."""
@@ -65,26 +193,55 @@ class A2ABrokerCore:
         self.message_handlers.update({
             MessageType.TASK_REQUEST: self._handle_task_request,
             MessageType.TASK_RESPONSE: self._handle_task_response,
-            MessageType.AGENT_MESSAGE: self._handle_agent_message,
-            MessageType.BROADCAST: self._handle_broadcast,
-            MessageType.CONVERSATION: self._handle_conversation_message
+            MessageType.STATUS_UPDATE: self._handle_agent_message,
+            MessageType.CONSTITUTIONAL_ALERT: self._handle_agent_message,
+            MessageType.QUESTION_PERIOD: self._handle_agent_message,
+            MessageType.COLLECTIVE_DECISION: self._handle_agent_message,
+            MessageType.EMERGENCY_BROADCAST: self._handle_agent_message,
+            BROADCAST_MESSAGE: self._handle_broadcast,
+            CONVERSATION_MESSAGE: self._handle_conversation_message
         })
     
-    async def _handle_task_request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+    async def dispatch_message(
+        self,
+        message_type: str,
+        message: Dict[str, Any],
+        trusted: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Dispatch a message to the handler registered for its type.
+        
+        ``MessageType`` keys select the direct (agent-to-agent) handlers;
+        broadcasts of any type are dispatched under ``BROADCAST_MESSAGE``.
+        """
+        handler = self.message_handlers.get(message_type)
+        if handler is None:
+            return _err(f"No handler for message type: {message_type}")
+        return await handler(message, trusted)
+    
+    async def _handle_task_request(
+        self,
+        message: Dict[str, Any],
+        trusted: bool = False
+    ) -> Dict[str, Any]:
         """Handle incoming task request."""
         try:
-            task_request = TaskRequest(**message)
+            task_request = _parse_message(TaskRequest, message, trusted)
             
             # Store the request
             await self.storage.store_task_request(task_request)
             
-            # Route to appropriate agent
+            # Route the incoming dict, carrying any generated ID
+            message.setdefault("request_id", task_request.request_id)
             result = await self._route_message_to_agent(
                 task_request.target_agent,
-                task_request.model_dump()
+                message,
+                MessageType.TASK_REQUEST,
+                task_request.requesting_agent
             )
             
-            await self.logfire_logger.info(
+            self._log(
+                "info",
                 "Task request handled",
                 request_id=task_request.request_id,
                 target_agent=task_request.target_agent
@@ -93,104 +250,141 @@ class A2ABrokerCore:
             return result
             
         except Exception as e:
-            await self.logfire_logger.error(
+            self._log(
+                "error",
                 "Task request handling failed",
                 error=str(e),
                 message=message
             )
-            return {"success": False, "error": str(e)}
+            return _err(e)
     
-    async def _handle_task_response(self, message: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_task_response(
+        self,
+        message: Dict[str, Any],
+        trusted: bool = False
+    ) -> Dict[str, Any]:
         """Handle incoming task response."""
         try:
-            task_response = TaskResponse(**message)
+            task_response = _parse_message(TaskResponse, message, trusted)
+            
+            # The requester is recorded on the original request
+            original_request = await self.storage.get_task_request(task_response.request_id)
+            if original_request is None:
+                return _err(f"Original request not found: {task_response.request_id}")
             
             # Store the response
             await self.storage.store_task_response(task_response)
             
             # Route back to requesting agent
+            message.setdefault("response_id", task_response.response_id)
             result = await self._route_message_to_agent(
-                task_response.requesting_agent,
-                task_response.model_dump()
+                original_request.requesting_agent,
+                message,
+                MessageType.TASK_RESPONSE,
+                task_response.responding_agent
             )
             
-            await self.logfire_logger.info(
+            self._log(
+                "info",
                 "Task response handled",
                 response_id=task_response.response_id,
-                requesting_agent=task_response.requesting_agent
+                requesting_agent=original_request.requesting_agent
             )
             
             return result
             
         except Exception as e:
-            await self.logfire_logger.error(
+            self._log(
+                "error",
                 "Task response handling failed",
                 error=str(e),
                 message=message
             )
-            return {"success": False, "error": str(e)}
+            return _err(e)
     
-    async def _handle_agent_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_agent_message(
+        self,
+        message: Dict[str, Any],
+        trusted: bool = False
+    ) -> Dict[str, Any]:
         """Handle general agent message."""
         try:
-            agent_message = AgentMessage(**message)
+            agent_message = _parse_message(AgentMessage, message, trusted)
             
             # Store the message
             await self.storage.store_agent_message(agent_message)
             
-            # Route to target agent
+            # Route to recipient agent
+            message.setdefault("message_id", agent_message.message_id)
             result = await self._route_message_to_agent(
-                agent_message.target_agent,
-                agent_message.model_dump()
+                agent_message.recipient_agent,
+                message,
+                agent_message.message_type,
+                agent_message.sender_agent
             )
             
-            await self.logfire_logger.info(
+            self._log(
+                "info",
                 "Agent message handled",
                 message_id=agent_message.message_id,
-                from_agent=agent_message.source_agent,
-                to_agent=agent_message.target_agent
+                from_agent=agent_message.sender_agent,
+                to_agent=agent_message.recipient_agent
             )
             
             return result
             
         except Exception as e:
-            await self.logfire_logger.error(
+            self._log(
+                "error",
                 "Agent message handling failed",
                 error=str(e),
                 message=message
             )
-            return {"success": False, "error": str(e)}
+            return _err(e)
     
-    async def _handle_broadcast(self, message: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_broadcast(
+        self,
+        message: Dict[str, Any],
+        trusted: bool = False
+    ) -> Dict[str, Any]:
         """Handle broadcast message."""
         try:
-            broadcast = BroadcastMessage(**message)
+            broadcast = _parse_message(BroadcastMessage, message, trusted)
             
-            # Store the broadcast
-            await self.storage.store_broadcast(broadcast)
+            # Store the broadcast while it is being delivered
+            store_task = asyncio.create_task(self.storage.store_broadcast(broadcast))
             
-            # Route to all agents or specified targets
-            targets = broadcast.target_agents or list(self.agent_queues.keys())
-            results = []
+            # Route to all agents or specified targets, sharing one payload
+            targets = broadcast.target_agents or self._all_agents
+            message.setdefault("broadcast_id", broadcast.broadcast_id)
             
-            for target in targets:
-                try:
-                    result = await self._route_message_to_agent(
-                        target,
-                        broadcast.model_dump()
+            outcomes = await asyncio.gather(
+                *(
+                    self._route_message_to_agent(
+                        target, message, broadcast.message_type, broadcast.sender_agent
                     )
+                    for target in targets
+                ),
+                return_exceptions=True
+            )
+            results = []
+            for target, outcome in zip(targets, outcomes, strict=True):
+                if isinstance(outcome, Exception):
                     results.append({
                         "target": target,
-                        "success": result.get("success", True)
+                        "success": False,
+                        "error": str(outcome)
                     })
-                except Exception as e:
+                else:
                     results.append({
                         "target": target,
-                        "success": False,
-                        "error": str(e)
+                        "success": outcome.get("success", True)
                     })
             
-            await self.logfire_logger.info(
+            await store_task
+            
+            self._log(
+                "info",
                 "Broadcast handled",
                 broadcast_id=broadcast.broadcast_id,
                 targets_count=len(targets),
@@ -204,38 +398,47 @@ class A2ABrokerCore:
             }
             
         except Exception as e:
-            await self.logfire_logger.error(
+            self._log(
+                "error",
                 "Broadcast handling failed",
                 error=str(e),
                 message=message
             )
-            return {"success": False, "error": str(e)}
+            return _err(e)
     
-    async def _handle_conversation_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_conversation_message(
+        self,
+        message: Dict[str, Any],
+        trusted: bool = False
+    ) -> Dict[str, Any]:
         """Handle conversation message."""
         try:
             conversation_id = message.get("conversation_id")
             if not conversation_id:
-                return {"success": False, "error": "Missing conversation_id"}
+                return _err("Missing conversation_id")
             
             # Get or create conversation context
             context = self.active_conversations.get(conversation_id)
             if not context:
-                return {"success": False, "error": "Conversation not found"}
+                return _err("Conversation not found")
             
-            # Add message to conversation
-            context.messages.append(message)
-            context.last_activity = datetime.now(timezone.utc)
+            # Record the message against the conversation
+            context.message_count += 1
+            context.last_activity = self._now()
             
             # Update storage
             await self.storage.store_conversation_context(context)
             
             # Route to conversation participants
+            source_agent = message.get("source_agent")
             for participant in context.participants:
-                if participant != message.get("source_agent"):
-                    await self._route_message_to_agent(participant, message)
+                if participant != source_agent:
+                    await self._route_message_to_agent(
+                        participant, message, None, source_agent, conversation_id
+                    )
             
-            await self.logfire_logger.info(
+            self._log(
+                "info",
                 "Conversation message handled",
                 conversation_id=conversation_id,
                 participants=len(context.participants)
@@ -244,49 +447,55 @@ class A2ABrokerCore:
             return {"success": True, "conversation_id": conversation_id}
             
         except Exception as e:
-            await self.logfire_logger.error(
+            self._log(
+                "error",
                 "Conversation message handling failed",
                 error=str(e),
                 message=message
             )
-            return {"success": False, "error": str(e)}
+            return _err(e)
     
     async def _route_message_to_agent(
         self,
         target_agent: str,
-        message: Dict[str, Any]
+        message: Dict[str, Any],
+        kind: Optional[MessageType] = None,
+        source_agent: Optional[str] = None,
+        conversation_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Route message to target agent's queue."""
         try:
             # Get agent queue
             queue = self.agent_queues.get(target_agent)
             if not queue:
-                return {
-                    "success": False,
-                    "error": f"Agent queue not found: {target_agent}"
-                }
+                return _err(f"Agent queue not found: {target_agent}")
             
             # Add message to queue
-            queue_result = await queue.enqueue(message)
-            
-            if not queue_result["success"]:
-                return queue_result
-            
-            await self.logfire_logger.debug(
-                "Message routed to agent",
-                target_agent=target_agent,
-                queue_size=queue.current_size()
-            )
-            
-            return {"success": True, "queued_at": datetime.now(timezone.utc).isoformat()}
+            if queue.is_full():
+                return _err(f"Agent queue full: {target_agent}")
+            queued_at = self._now_iso()
+            queue.enqueue(RoutedMessage(
+                kind, message, source_agent, target_agent, conversation_id, queued_at
+            ))
+            
+            if self._debug_enabled:
+                self._log(
+                    "debug",
+                    "Message routed to agent",
+                    target_agent=target_agent,
+                    queue_size=queue.current_size()
+                )
+            
+            return {"success": True, "queued_at": queued_at}
             
         except Exception as e:
-            await self.logfire_logger.error(
+            self._log(
+                "error",
                 "Message routing failed",
                 target_agent=target_agent,
                 error=str(e)
             )
-            return {"success": False, "error": str(e)}
+            return _err(e)
     
     async def get_agent_queue_status(self, agent_name: str) -> Dict[str, Any]:
         """Get status of agent's message queue."""
@@ -299,7 +508,7 @@ class A2ABrokerCore:
             "current_size": queue.current_size(),
             "max_size": queue.max_queue_size,
             "priority_processing": queue.priority_processing,
-            "last_activity": queue.last_activity.isoformat() if queue.last_activity else None
+            "last_activity": queue.last_processed.isoformat() if queue.last_processed else None
         }
     
     async def get_all_queue_status(self) -> Dict[str, Any]:
@@ -318,23 +527,31 @@ class A2ABrokerCore:
         return {
             "conversation_id": conversation_id,
             "participants": context.participants,
-            "message_count": len(context.messages),
-            "started_at": context.started_at.isoformat(),
+            "message_count": context.message_count,
+            "started_at": context.created_at.isoformat(),
             "last_activity": context.last_activity.isoformat() if context.last_activity else None,
-            "governance_context": context.governance_context
+            "constitutional_oversight": context.constitutional_oversight
         }
     
     async def close(self) -> None:
         """Close the broker and cleanup resources."""
         await self.logfire_logger.info("A2A Broker shutting down")
         
+        # Emit any buffered log records before stopping the drain task
+        await self._emit_logs()
+        if self._log_task is not None:
+            self._log_task.cancel()
+            await asyncio.gather(self._log_task, return_exceptions=True)
+            self._log_task = None
+        
         # Clear active conversations
         self.active_conversations.clear()
         
         # Clear agent queues
         for queue in self.agent_queues.values():
-            await queue.clear()
+            queue.clear()
         
         self.agent_queues.clear()
+        self._all_agents = ()
         
         await self.logfire_logger.info("A2A Broker shutdown complete")
\ No newline at end of file
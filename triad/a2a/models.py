@@ -4,7 +4,8 @@ A2A Communication Models
 Data models for agent-to-agent communication with constitutional oversight.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Deque
+from collections import deque
 from pydantic import BaseModel, Field
 from datetime import datetime, timezone
 from enum import Enum
@@ -251,7 +252,7 @@ class MessageQueue(BaseModel):
     agent_name: str = Field(..., description="Queue owner agent")
     
     # Queue contents
-    pending_messages: List[str] = Field(default_factory=list, description="Pending message IDs")
+    pending_messages: Deque[Any] = Field(default_factory=deque, description="Pending message IDs or payloads")
     processing_message: Optional[str] = Field(None, description="Currently processing message ID")
     
     # Queue metrics
@@ -271,6 +272,24 @@ class MessageQueue(BaseModel):
         """Check if queue is full."""
         return len(self.pending_messages) >= self.max_queue_size
     
+    def current_size(self) -> int:
+        """Number of pending messages."""
+        return len(self.pending_messages)
+    
+    def enqueue(self, message: Any) -> int:
+        """Append a message ID or payload and return its position in the queue."""
+        pending = self.pending_messages
+        pending.append(message)
+        return len(pending)
+    
+    def dequeue(self) -> Optional[Any]:
+        """Remove and return the oldest pending message, if any."""
+        return self.pending_messages.popleft() if self.pending_messages else None
+    
+    def clear(self) -> None:
+        """Drop all pending messages."""
+        self.pending_messages.clear()
+    
     def get_queue_health(self) -> Dict[str, Any]:
         """Get queue health metrics."""
         success_rate = 0.0
@@ -5,15 +5,38 @@ Storage layer for A2A communication with constitutional record keeping
 and parliamentary accountability.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert, update, delete
+import asyncio
+import functools
 import json
+import secrets
 
 from .models import TaskRequest, TaskResponse, AgentMessage, ConversationContext, BroadcastMessage
 
 
+def _serialized(method):
+    """
+    Run a storage method with exclusive use of the session.
+    
+    An AsyncSession cannot run operations concurrently, and the broker
+    writes from background tasks as well as from its callers, so every
+    method takes the storage lock. A failed operation is rolled back so the
+    session stays usable for the next caller.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        async with self._session_lock:
+            try:
+                return await method(self, *args, **kwargs)
+            except Exception:
+                await self.db_session.rollback()
+                raise
+    return wrapper
+
+
 class A2AStorage:
     """
     Storage layer for A2A communication system.
@@ -24,7 +47,9 @@ class A2AStorage:
     
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
+        self._session_lock = asyncio.Lock()
     
+    @_serialized
     async def store_task_request(self, request: TaskRequest) -> None:
         """Store task request with constitutional oversight."""
         request_data = {
@@ -65,6 +90,7 @@ class A2AStorage:
         )
         await self.db_session.commit()
     
+    @_serialized
     async def get_task_request(self, request_id: str) -> Optional[TaskRequest]:
         """Retrieve task request by ID."""
         result = await self.db_session.execute(
@@ -96,6 +122,7 @@ class A2AStorage:
             parliamentary_session_id=row.parliamentary_session_id
         )
     
+    @_serialized
     async def store_task_response(self, response: TaskResponse) -> None:
         """Store task response with constitutional compliance tracking."""
         response_data = {
@@ -142,6 +169,7 @@ class A2AStorage:
         
         await self.db_session.commit()
     
+    @_serialized
     async def store_agent_message(self, message: AgentMessage) -> None:
         """Store agent message with parliamentary record."""
         message_data = {
@@ -186,9 +214,28 @@ class A2AStorage:
         )
         await self.db_session.commit()
     
-    async def store_conversation_context(self, context: ConversationContext) -> None:
-        """Store conversation context for parliamentary record."""
-        context_data = {
+    _CONVERSATION_UPSERT = """
+        INSERT INTO a2a_conversations (
+            context_id, conversation_type, participants, initiated_by,
+            status, current_topic, constitutional_oversight,
+            parliamentary_record, crown_monitoring, message_count,
+            last_activity, created_at, parliamentary_session_id
+        ) VALUES (
+            :context_id, :conversation_type, :participants, :initiated_by,
+            :status, :current_topic, :constitutional_oversight,
+            :parliamentary_record, :crown_monitoring, :message_count,
+            :last_activity, :created_at, :parliamentary_session_id
+        ) ON CONFLICT (context_id) DO UPDATE SET
+            status = EXCLUDED.status,
+            current_topic = EXCLUDED.current_topic,
+            message_count = EXCLUDED.message_count,
+            last_activity = EXCLUDED.last_activity
+    """
+    
+    @staticmethod
+    def _conversation_row(context: ConversationContext) -> Dict[str, Any]:
+        """Build the a2a_conversations row for a conversation context."""
+        return {
             "context_id": context.context_id,
             "conversation_type": context.conversation_type,
             "participants": json.dumps(context.participants),
@@ -203,30 +250,33 @@ class A2AStorage:
             "created_at": context.created_at,
             "parliamentary_session_id": context.parliamentary_session_id
         }
-        
+    
+    @_serialized
+    async def store_conversation_context(self, context: ConversationContext) -> None:
+        """Store conversation context for parliamentary record."""
         # Use upsert (INSERT ... ON CONFLICT DO UPDATE)
         await self.db_session.execute(
-            """
-            INSERT INTO a2a_conversations (
-                context_id, conversation_type, participants, initiated_by,
-                status, current_topic, constitutional_oversight,
-                parliamentary_record, crown_monitoring, message_count,
-                last_activity, created_at, parliamentary_session_id
-            ) VALUES (
-                :context_id, :conversation_type, :participants, :initiated_by,
-                :status, :current_topic, :constitutional_oversight,
-                :parliamentary_record, :crown_monitoring, :message_count,
-                :last_activity, :created_at, :parliamentary_session_id
-            ) ON CONFLICT (context_id) DO UPDATE SET
-                status = EXCLUDED.status,
-                current_topic = EXCLUDED.current_topic,
-                message_count = EXCLUDED.message_count,
-                last_activity = EXCLUDED.last_activity
-            """,
-            context_data
+            self._CONVERSATION_UPSERT,
+            self._conversation_row(context)
+        )
+        await self.db_session.commit()
+    
+    @_serialized
+    async def store_conversation_contexts_bulk(
+        self,
+        contexts: List[ConversationContext]
+    ) -> None:
+        """Upsert several conversation contexts with a single execute and commit."""
+        if not contexts:
+            return
+        
+        await self.db_session.execute(
+            self._CONVERSATION_UPSERT,
+            [self._conversation_row(context) for context in contexts]
         )
         await self.db_session.commit()
     
+    @_serialized
     async def store_broadcast(self, broadcast: BroadcastMessage) -> None:
         """Store broadcast message record."""
         broadcast_data = {
@@ -269,29 +319,68 @@ class A2AStorage:
         )
         await self.db_session.commit()
     
-    async def store_queued_message(self, message_id: str, message: Dict[str, Any]) -> None:
-        """Store message in agent queue."""
-        queue_data = {
+    _QUEUED_MESSAGE_INSERT = """
+        INSERT INTO a2a_message_queue (
+            message_id, agent_name, message_data, queued_at, status, priority
+        ) VALUES (
+            :message_id, :agent_name, :message_data, :queued_at, :status, :priority
+        )
+    """
+    
+    @staticmethod
+    def _queued_message_row(
+        message_id: str,
+        message: Dict[str, Any],
+        message_json: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the a2a_message_queue row for a message."""
+        return {
             "message_id": message_id,
             "agent_name": message.get("target_agent", "unknown"),
-            "message_data": json.dumps(message),
+            "message_data": message_json if message_json is not None else json.dumps(message),
             "queued_at": datetime.now(timezone.utc),
             "status": "queued",
             "priority": message.get("priority", "routine")
         }
+    
+    @_serialized
+    async def store_queued_message(
+        self,
+        message_id: str,
+        message: Dict[str, Any],
+        message_json: Optional[str] = None
+    ) -> None:
+        """Store message in agent queue.
+        
+        ``message_json`` is stored as-is when the caller already serialized
+        the message.
+        """
+        await self.db_session.execute(
+            self._QUEUED_MESSAGE_INSERT,
+            self._queued_message_row(message_id, message, message_json)
+        )
+        await self.db_session.commit()
+    
+    @_serialized
+    async def store_queued_messages_batch(
+        self,
+        messages: List[Tuple[str, Dict[str, Any], Optional[str]]]
+    ) -> None:
+        """Store several queued messages with one multi-row insert and commit.
+        
+        Each entry is ``(message_id, message, message_json)``; ``message_json``
+        may be None to serialize ``message`` here.
+        """
+        if not messages:
+            return
         
         await self.db_session.execute(
-            """
-            INSERT INTO a2a_message_queue (
-                message_id, agent_name, message_data, queued_at, status, priority
-            ) VALUES (
-                :message_id, :agent_name, :message_data, :queued_at, :status, :priority
-            )
-            """,
-            queue_data
+            self._QUEUED_MESSAGE_INSERT,
+            [self._queued_message_row(*entry) for entry in messages]
         )
         await self.db_session.commit()
     
+    @_serialized
     async def get_queued_message(self, message_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve queued message by ID."""
         result = await self.db_session.execute(
@@ -313,6 +402,7 @@ class A2AStorage:
             "priority": row.priority
         }
     
+    @_serialized
     async def update_message_status(self, message_id: str, status: str) -> None:
         """Update message status in queue."""
         await self.db_session.execute(
@@ -321,10 +411,21 @@ class A2AStorage:
         )
         await self.db_session.commit()
     
-    async def store_parliamentary_record(self, entry: Dict[str, Any]) -> None:
-        """Store entry in parliamentary record (Hansard)."""
-        record_data = {
-            "record_id": f"hansard_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{entry.get('event_type', 'unknown')}",
+    _PARLIAMENTARY_RECORD_INSERT = """
+        INSERT INTO a2a_parliamentary_records (
+            record_id, timestamp, event_type, data, recorded_by,
+            constitutional_oversight, parliamentary_session_id
+        ) VALUES (
+            :record_id, :timestamp, :event_type, :data, :recorded_by,
+            :constitutional_oversight, :parliamentary_session_id
+        )
+    """
+    
+    @staticmethod
+    def _parliamentary_record_row(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the a2a_parliamentary_records row for an entry."""
+        return {
+            "record_id": f"hansard_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{entry.get('event_type', 'unknown')}_{secrets.token_hex(4)}",
             "timestamp": entry["timestamp"],
             "event_type": entry["event_type"],
             "data": json.dumps(entry["data"]),
@@ -332,21 +433,29 @@ class A2AStorage:
             "constitutional_oversight": entry.get("constitutional_oversight", True),
             "parliamentary_session_id": entry.get("parliamentary_session_id")
         }
+    
+    @_serialized
+    async def store_parliamentary_record(self, entry: Dict[str, Any]) -> None:
+        """Store entry in parliamentary record (Hansard)."""
+        await self.db_session.execute(
+            self._PARLIAMENTARY_RECORD_INSERT,
+            self._parliamentary_record_row(entry)
+        )
+        await self.db_session.commit()
+    
+    @_serialized
+    async def store_parliamentary_records_batch(self, entries: List[Dict[str, Any]]) -> None:
+        """Store several parliamentary record entries with one multi-row insert and commit."""
+        if not entries:
+            return
         
         await self.db_session.execute(
-            """
-            INSERT INTO a2a_parliamentary_records (
-                record_id, timestamp, event_type, data, recorded_by,
-                constitutional_oversight, parliamentary_session_id
-            ) VALUES (
-                :record_id, :timestamp, :event_type, :data, :recorded_by,
-                :constitutional_oversight, :parliamentary_session_id
-            )
-            """,
-            record_data
+            self._PARLIAMENTARY_RECORD_INSERT,
+            [self._parliamentary_record_row(entry) for entry in entries]
         )
         await self.db_session.commit()
     
+    @_serialized
     async def store_cache_config(self, config: Dict[str, Any]) -> None:
         """Store cache coordination configuration."""
         config_data = {
@@ -374,6 +483,7 @@ class A2AStorage:
         )
         await self.db_session.commit()
     
+    @_serialized
     async def get_agent_messages(
         self,
         agent_name: str,
@@ -410,6 +520,7 @@ class A2AStorage:
         
         return messages
     
+    @_serialized
     async def get_conversation_history(
         self,
         context_id: str
@@ -443,6 +554,7 @@ class A2AStorage:
         
         return messages
     
+    @_serialized
     async def get_constitutional_records(
         self,
         start_date: Optional[datetime] = None,
@@ -483,6 +595,7 @@ class A2AStorage:
         
         return records
     
+    @_serialized
     async def cleanup_expired_messages(self) -> int:
         """Clean up expired messages and return count."""
         current_time = datetime.now(timezone.utc)
@@ -504,6 +617,7 @@ class A2AStorage:
         
         return result.rowcount
     
+    @_serialized
     async def get_communication_statistics(self) -> Dict[str, Any]:
         """Get A2A communication statistics."""
         # Task request statistics
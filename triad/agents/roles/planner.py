@@ -126,7 +126,7 @@ class PlannerAgent(BaseAgent):
                     dependencies=dependencies,
                     priority=priority,
                     constitutional_compliance=True,
-                    parliamentary_session_id=await ctx.deps.get_current_parliamentary_session(),
+                    parliamentary_session_id=ctx.deps.get_current_parliamentary_session(),
                     created_by="planner_agent",
                     created_at=datetime.now(timezone.utc)
                 )
@@ -16,7 +16,9 @@ import uvicorn
 
 from .routes import agents, health, parliamentary
 from .models import ErrorResponse
-from triad.core.dependencies import get_triad_deps, TriadDeps
+from triad.core.dependencies import (
+    get_triad_deps, TriadDeps, close_http_client, shutdown_procedure_executor
+)
 from triad.core.constitutional import ConstitutionalFramework
 
 
@@ -57,6 +59,10 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, 'constitutional_framework'):
         await app.state.constitutional_framework.shutdown()
     
+    # Release resources shared by all TriadDeps instances
+    await close_http_client()
+    shutdown_procedure_executor()
+    
     logfire.info("Triad Model API shutdown complete")
 
 
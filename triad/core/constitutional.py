@@ -7,11 +7,16 @@ based on the Canadian Westminster Parliamentary System.
 
 from enum import Enum
 from typing import Dict, List, Optional, Any
+from collections import OrderedDict
 from pydantic import BaseModel
 from datetime import datetime, timezone
 import uuid
 
 
+# Maximum number of memoized decision validations (least recently used evicted)
+_VALIDATION_CACHE_MAX = 4096
+
+
 class ConstitutionalAuthority(str, Enum):
     """Westminster constitutional authority levels."""
     LEGISLATIVE = "legislative"  # Planner Agent - Parliament
@@ -100,7 +105,10 @@ class ConstitutionalFramework:
     """
     
     def __init__(self):
-        self.current_session: Optional[ParliamentarySession] = None
+        self._current_session: Optional[ParliamentarySession] = None
+        # Incremented whenever the current session changes, so dependants
+        # can cache session-derived values
+        self.session_epoch = 0
         self.constitutional_principles = {
             principle: {
                 "description": self._get_principle_description(principle),
@@ -111,6 +119,19 @@ class ConstitutionalFramework:
         }
         self.active_decisions: Dict[str, ConstitutionalDecision] = {}
         self.constitutional_record: List[Dict[str, Any]] = []
+        # Validation outcomes keyed by the decision fields the rules inspect
+        self._validation_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+    
+    @property
+    def current_session(self) -> Optional[ParliamentarySession]:
+        """Current parliamentary session, if one has been started."""
+        return self._current_session
+    
+    @current_session.setter
+    def current_session(self, session: Optional[ParliamentarySession]):
+        self._current_session = session
+        self.session_epoch += 1
+        self._validation_cache.clear()
     
     def _get_principle_description(self, principle: ConstitutionalPrinciple) -> str:
         """Get description of constitutional principle."""
@@ -143,9 +164,44 @@ class ConstitutionalFramework:
         
         This is the core constitutional validation mechanism that ensures
         all agent decisions comply with Westminster parliamentary principles.
+        Outcomes are memoized per parliamentary session on the fields the
+        rules inspect; every decision is still recorded individually.
         """
+        cache_key = (
+            decision.constitutional_authority,
+            decision.decision_type,
+            decision.requires_collective_approval,
+            decision.requires_royal_assent,
+            tuple(decision.constitutional_principles),
+            bool(decision.description)
+        )
+        
+        cached = self._validation_cache.get(cache_key)
+        if cached is None:
+            cached = self._evaluate_decision(decision)
+            self._validation_cache[cache_key] = cached
+            if len(self._validation_cache) > _VALIDATION_CACHE_MAX:
+                self._validation_cache.popitem(last=False)
+        else:
+            self._validation_cache.move_to_end(cache_key)
+        
         validation_result = {
             "decision_id": decision.decision_id,
+            "constitutional_compliance": cached["constitutional_compliance"],
+            "violations": list(cached["violations"]),
+            "required_approvals": list(cached["required_approvals"]),
+            "constitutional_authority_valid": cached["constitutional_authority_valid"],
+            "recommendations": list(cached["recommendations"])
+        }
+        
+        # Record decision in constitutional record
+        self._record_constitutional_decision(decision, validation_result)
+        
+        return validation_result
+    
+    def _evaluate_decision(self, decision: ConstitutionalDecision) -> Dict[str, Any]:
+        """Apply the constitutional rules to a decision."""
+        validation_result = {
             "constitutional_compliance": True,
             "violations": [],
             "required_approvals": [],
@@ -154,7 +210,7 @@ class ConstitutionalFramework:
         }
         
         # Validate constitutional authority
-        if not await self._validate_authority(decision):
+        if not self._validate_authority(decision):
             validation_result["constitutional_compliance"] = False
             validation_result["constitutional_authority_valid"] = False
             validation_result["violations"].append(
@@ -162,7 +218,7 @@ class ConstitutionalFramework:
             )
         
         # Check separation of powers
-        if not await self._validate_separation_of_powers(decision):
+        if not self._validate_separation_of_powers(decision):
             validation_result["constitutional_compliance"] = False
             validation_result["violations"].append(
                 "Decision violates separation of powers principle"
@@ -178,17 +234,14 @@ class ConstitutionalFramework:
         
         # Validate against constitutional principles
         for principle in decision.constitutional_principles:
-            principle_validation = await self._validate_principle(decision, principle)
+            principle_validation = self._validate_principle(decision, principle)
             if not principle_validation["compliant"]:
                 validation_result["constitutional_compliance"] = False
                 validation_result["violations"].extend(principle_validation["violations"])
         
-        # Record decision in constitutional record
-        await self._record_constitutional_decision(decision, validation_result)
-        
         return validation_result
     
-    async def _validate_authority(self, decision: ConstitutionalDecision) -> bool:
+    def _validate_authority(self, decision: ConstitutionalDecision) -> bool:
         """Validate that the agent has authority for this type of decision."""
         authority_mappings = {
             "planning": [ConstitutionalAuthority.LEGISLATIVE],
@@ -202,7 +255,7 @@ class ConstitutionalFramework:
         allowed_authorities = authority_mappings.get(decision.decision_type, [])
         return decision.constitutional_authority in allowed_authorities
     
-    async def _validate_separation_of_powers(self, decision: ConstitutionalDecision) -> bool:
+    def _validate_separation_of_powers(self, decision: ConstitutionalDecision) -> bool:
         """Ensure decision respects separation of powers."""
         # Legislative agents cannot execute or validate
         if (decision.constitutional_authority == ConstitutionalAuthority.LEGISLATIVE and 
@@ -221,7 +274,7 @@ class ConstitutionalFramework:
         
         return True
     
-    async def _validate_principle(
+    def _validate_principle(
         self, 
         decision: ConstitutionalDecision, 
         principle: ConstitutionalPrinciple
@@ -257,7 +310,7 @@ class ConstitutionalFramework:
         
         return validation
     
-    async def _record_constitutional_decision(
+    def _record_constitutional_decision(
         self, 
         decision: ConstitutionalDecision, 
         validation_result: Dict[str, Any]
@@ -298,7 +351,7 @@ class ConstitutionalFramework:
         )
         
         # Record session start
-        await self._record_constitutional_decision(
+        self._record_constitutional_decision(
             ConstitutionalDecision(
                 constitutional_authority=ConstitutionalAuthority.CROWN,
                 decision_type="session_start",
@@ -5,15 +5,64 @@ Implements comprehensive dependency injection with constitutional oversight,
 parliamentary procedures, and Crown authority management.
 """
 
-from dataclasses import dataclass
-from typing import Protocol, Optional, Dict, Any, List
+from dataclasses import dataclass, field, replace
+from typing import Protocol, Optional, Dict, Any, List, Callable, Awaitable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import functools
+import inspect
+import random
 import logfire
 from datetime import datetime, timezone
+from sqlalchemy import insert, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from httpx import AsyncClient
+from httpx import AsyncClient, Limits, Timeout
 
 from .constitutional import ConstitutionalFramework, ConstitutionalDecision, ConstitutionalAuthority
+from ..database.models import ConstitutionalRecordTable
+
+
+# Maximum number of constitutional records written in a single INSERT
+_RECORD_BATCH_MAX = 256
+
+# Built once so every batch reuses SQLAlchemy's cached compiled form
+_RECORD_INSERT = insert(ConstitutionalRecordTable)
+
+# Lets a record batch commit without waiting for the WAL flush
+_ASYNC_COMMIT = text("SET LOCAL synchronous_commit = off")
+
+# Maximum number of events handed to the dispatcher in one pass
+_EVENT_BATCH_MAX = 64
+
+_OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+
+async def _call_logger(method: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """Call a logger method, awaiting it only if it returned an awaitable.
+    
+    Logfire's own methods are synchronous; injected loggers may be async.
+    """
+    result = method(*args, **kwargs)
+    if inspect.isawaitable(result):
+        await result
+
+
+# Westminster Crown powers: dismissal, dissolution, appointment, assent
+_VALID_PREROGATIVES = frozenset({
+    "dismiss", "dissolve", "appoint", "refuse_assent", "emergency_powers"
+})
+
+# External system operations that are always traced regardless of sampling
+_HEAVY_INTEGRATION_OPERATIONS = frozenset({
+    "insert", "update", "delete", "modify", "change", "post"
+})
+
+# Process-wide HTTP client shared by every TriadDeps (see get_http_client)
+_http_client: Optional[AsyncClient] = None
+
+# Bounded pool for synchronous parliamentary procedure implementations
+_procedure_executor: Optional[ThreadPoolExecutor] = None
 
 
 class MCPClient(Protocol):
@@ -33,7 +82,11 @@ class A2ABroker(Protocol):
 
 
 class ParliamentaryProcedure(Protocol):
-    """Protocol for parliamentary procedures and democratic processes."""
+    """Protocol for parliamentary procedures and democratic processes.
+    
+    Implementations may provide plain synchronous methods instead; TriadDeps
+    runs those in a bounded thread pool so they never block the event loop.
+    """
     async def formal_response(self, question: str, responding_agent: str, 
                              questioning_agent: str, constitutional_requirement: bool) -> dict: ...
     async def ministerial_defense(self, decision: str, minister: str, challenger: str) -> dict: ...
@@ -59,70 +112,301 @@ class CrownPrerogative(Protocol):
     async def activate_emergency_governance(self) -> dict: ...
 
 
-@dataclass
+class _EventBus:
+    """
+    Bounded in-process event buffer drained by a single dispatcher task.
+    
+    Producers call ``submit`` and return without waiting for delivery; the
+    dispatcher hands events to ``dispatch`` in batches. When the buffer is
+    full, ``overflow_policy`` decides whether the oldest event is dropped,
+    the new event is dropped, or the producer waits for space.
+    """
+    
+    def __init__(
+        self,
+        dispatch: Callable[[List[dict]], Awaitable[None]],
+        max_size: int = 1024,
+        overflow_policy: str = "drop_oldest"
+    ):
+        if overflow_policy not in _OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid event bus overflow policy: {overflow_policy}")
+        
+        self._dispatch = dispatch
+        self._events: deque = deque()
+        self._max_size = max_size
+        self._overflow_policy = overflow_policy
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.dropped_events = 0
+        self.failed_batches = 0
+    
+    async def submit(self, event: dict) -> bool:
+        """Queue an event for delivery. Returns False if it was dropped."""
+        while len(self._events) >= self._max_size:
+            if self._overflow_policy == "drop_newest":
+                self.dropped_events += 1
+                return False
+            if self._overflow_policy == "drop_oldest":
+                self._events.popleft()
+                self.dropped_events += 1
+                break
+            self._space.clear()
+            await self._space.wait()
+        
+        self._events.append(event)
+        self._idle.clear()
+        self._ready.set()
+        
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._run())
+        return True
+    
+    async def _run(self):
+        while True:
+            await self._ready.wait()
+            while self._events:
+                batch = [
+                    self._events.popleft()
+                    for _ in range(min(len(self._events), _EVENT_BATCH_MAX))
+                ]
+                self._space.set()
+                try:
+                    await self._dispatch(batch)
+                except Exception as e:
+                    # A failed batch must not stop the dispatcher
+                    self.failed_batches += 1
+                    logfire.error(
+                        "Event bus batch dispatch failed",
+                        error=str(e),
+                        events=len(batch)
+                    )
+            self._ready.clear()
+            self._idle.set()
+    
+    async def flush(self):
+        """Wait until every submitted event has been dispatched."""
+        if self._dispatcher is not None and not self._dispatcher.done():
+            await self._idle.wait()
+    
+    def close(self):
+        """Stop the dispatcher task."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+
+
+@dataclass(slots=True)
 class TriadDeps:
     """
     Core dependencies container for all agents with complete Westminster framework.
     
     This contains all the dependencies needed for constitutional AI governance
-    following Westminster parliamentary principles.
+    following Westminster parliamentary principles. The container is slotted,
+    so it carries no per-instance ``__dict__``. The crisis manager and Crown
+    prerogative are built from their factories on first use, so request
+    paths that never touch them do not construct them.
     """
     db_session: AsyncSession
     mcp_client: MCPClient
     a2a_broker: A2ABroker
     logfire_logger: logfire
     parliamentary_procedure: ParliamentaryProcedure
-    constitutional_crisis_manager: ConstitutionalCrisisManager
-    crown_prerogative: CrownPrerogative
+    constitutional_crisis_manager_factory: Callable[[], ConstitutionalCrisisManager]
+    crown_prerogative_factory: Callable[[], CrownPrerogative]
     constitutional_framework: ConstitutionalFramework
     config: 'TriadConfig'
-    http_client: Optional[AsyncClient] = None
     
-    async def log_event(self, event_type: str, data: dict):
-        """Centralized event logging with constitutional oversight."""
-        await self.logfire_logger.info(
+    # Constitutional records are buffered and written in batches on a
+    # session of their own, so the flusher never shares db_session with agents
+    _record_buffer: asyncio.Queue = field(default_factory=asyncio.Queue, init=False, repr=False)
+    _record_flusher: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+    _record_session: Optional[AsyncSession] = field(default=None, init=False, repr=False)
+    
+    # Session ID cached against ConstitutionalFramework.session_epoch
+    _session_id_cache: Optional[str] = field(default=None, init=False, repr=False)
+    _session_epoch: int = field(default=-1, init=False, repr=False)
+    
+    # Events are delivered off the caller's path by the event bus dispatcher
+    _event_bus: Optional[_EventBus] = field(default=None, init=False, repr=False)
+    
+    # Lazily built from the factories above
+    _constitutional_crisis_manager: Optional[ConstitutionalCrisisManager] = field(
+        default=None, init=False, repr=False
+    )
+    _crown_prerogative: Optional[CrownPrerogative] = field(default=None, init=False, repr=False)
+    
+    @property
+    def constitutional_crisis_manager(self) -> ConstitutionalCrisisManager:
+        """Constitutional crisis manager, constructed on first access."""
+        if self._constitutional_crisis_manager is None:
+            self._constitutional_crisis_manager = self.constitutional_crisis_manager_factory()
+        return self._constitutional_crisis_manager
+    
+    @property
+    def crown_prerogative(self) -> CrownPrerogative:
+        """Crown prerogative, constructed on first access."""
+        if self._crown_prerogative is None:
+            self._crown_prerogative = self.crown_prerogative_factory()
+        return self._crown_prerogative
+    
+    @property
+    def http_client(self) -> AsyncClient:
+        """Shared HTTP client; its connection pool outlives this container."""
+        return get_http_client(self.config)
+    
+    async def log_event(self, event_type: str, data: dict, timestamp: Optional[datetime] = None):
+        """Centralized event logging with constitutional oversight.
+        
+        The event is queued on the event bus and delivered to Logfire, the
+        constitutional record and the A2A broker by a background dispatcher.
+        Use ``flush()`` to wait for delivery. ``timestamp`` lets callers that
+        already stamped the event reuse the same instant.
+        """
+        if self._event_bus is None:
+            self._event_bus = _EventBus(
+                self._dispatch_events,
+                max_size=self.config.EVENT_BUS_MAX_SIZE,
+                overflow_policy=self.config.EVENT_BUS_OVERFLOW_POLICY
+            )
+        
+        await self._event_bus.submit({
+            "event_type": event_type,
+            "data": data,
+            "timestamp": timestamp or datetime.now(timezone.utc)
+        })
+    
+    async def _dispatch_events(self, events: List[dict]):
+        """Deliver a batch of events from the event bus."""
+        deliver = self._deliver_event
+        await asyncio.gather(*(deliver(event) for event in events))
+    
+    async def _deliver_event(self, event: dict):
+        """Fan a single event out to Logfire, Hansard and the A2A broker."""
+        event_type = event["event_type"]
+        data = event["data"]
+        
+        results = await asyncio.gather(
+            # Westminster parliamentary procedure: Log for constitutional record
+            self.log_constitutional_record(event_type, data, event["timestamp"]),
+            # Notify other agents via A2A protocol
+            self.a2a_broker.broadcast_event({
+                "event_type": event_type,
+                "data": data,
+                "timestamp": event["timestamp"].isoformat(),
+                "constitutional_branch": data.get("agent", "unknown")
+            }),
+            return_exceptions=True
+        )
+        
+        await _call_logger(
+            self.logfire_logger.info,
             f"Event: {event_type}",
             event_type=event_type,
             constitutional_oversight=True,
             **data
         )
         
-        # Westminster parliamentary procedure: Log for constitutional record
-        await self.log_constitutional_record(event_type, data)
-        
-        # Notify other agents via A2A protocol
-        await self.a2a_broker.broadcast_event({
-            "event_type": event_type,
-            "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "constitutional_branch": data.get("agent", "unknown")
-        })
+        for result in results:
+            if isinstance(result, Exception):
+                await _call_logger(
+                    self.logfire_logger.error,
+                    "Event delivery failed",
+                    event_type=event_type,
+                    error=str(result)
+                )
     
-    async def log_constitutional_record(self, event_type: str, data: dict):
-        """Log events for constitutional parliamentary record (Hansard equivalent)."""
+    async def log_constitutional_record(
+        self,
+        event_type: str,
+        data: dict,
+        timestamp: Optional[datetime] = None
+    ):
+        """Log events for constitutional parliamentary record (Hansard equivalent).
+        
+        The record is queued and returns immediately; a background flusher
+        writes queued records in batches of up to ``_RECORD_BATCH_MAX`` rows
+        with a single INSERT and commit.
+        """
         constitutional_record = {
             "event_type": event_type,
             "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp or datetime.now(timezone.utc),
             "constitutional_authority": data.get("agent", "system"),
-            "parliamentary_session": await self.get_current_parliamentary_session(),
+            "parliamentary_session_id": self.get_current_parliamentary_session(),
             "recorded_by": "constitutional_clerk"
         }
         
-        # Store in constitutional record database
-        from triad.database.models import ConstitutionalRecordTable
-        from sqlalchemy import insert
+        self._record_buffer.put_nowait(constitutional_record)
         
-        await self.db_session.execute(
-            insert(ConstitutionalRecordTable).values(**constitutional_record)
-        )
-        await self.db_session.commit()
+        if self._record_flusher is None or self._record_flusher.done():
+            self._record_flusher = asyncio.create_task(self._flush_constitutional_records())
+    
+    async def _flush_constitutional_records(self):
+        """Drain the record buffer, writing one multi-row INSERT per batch."""
+        buffer = self._record_buffer
+        while True:
+            batch = [await buffer.get()]
+            while len(batch) < _RECORD_BATCH_MAX and not buffer.empty():
+                batch.append(buffer.get_nowait())
+            
+            try:
+                await self._write_constitutional_records(batch)
+            except Exception as e:
+                await _call_logger(
+                    self.logfire_logger.error,
+                    "Constitutional record batch write failed",
+                    error=str(e),
+                    records=len(batch)
+                )
+            finally:
+                for _ in batch:
+                    buffer.task_done()
     
-    async def get_current_parliamentary_session(self) -> Optional[str]:
+    async def _write_constitutional_records(self, records: List[dict]):
+        """Store a batch of records in the constitutional record database.
+        
+        The whole batch is one transaction on the flusher's own session, and
+        a failed batch is rolled back so the next one starts clean. With
+        ``RECORD_ASYNC_COMMIT`` on PostgreSQL the commit does not wait for the
+        WAL to reach disk, so a crash can lose the last few batches but never
+        corrupts the record.
+        """
+        if self._record_session is None:
+            self._record_session = AsyncSession(self.db_session.bind)
+        session = self._record_session
+        
+        try:
+            if (self.config.RECORD_ASYNC_COMMIT
+                    and session.get_bind().dialect.name == "postgresql"):
+                await session.execute(_ASYNC_COMMIT)
+            await session.execute(_RECORD_INSERT, records)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+    
+    async def flush(self):
+        """Wait until queued events and constitutional records are written."""
+        if self._event_bus is not None:
+            await self._event_bus.flush()
+        await self.flush_constitutional_records()
+    
+    async def flush_constitutional_records(self):
+        """Wait until every queued constitutional record has been written."""
+        if self._record_flusher is not None and not self._record_flusher.done():
+            await self._record_buffer.join()
+    
+    def get_current_parliamentary_session(self) -> Optional[str]:
         """Get current parliamentary session ID."""
-        if self.constitutional_framework.current_session:
-            return self.constitutional_framework.current_session.session_id
-        return None
+        framework = self.constitutional_framework
+        if framework.session_epoch != self._session_epoch:
+            session = framework.current_session
+            self._session_id_cache = session.session_id if session else None
+            self._session_epoch = framework.session_epoch
+        return self._session_id_cache
     
     async def exercise_crown_prerogative(
         self, 
@@ -132,39 +416,49 @@ class TriadDeps:
     ) -> Dict[str, Any]:
         """Exercise Crown prerogative powers (Governor General equivalent)."""
         
-        # Westminster Crown powers: dismissal, dissolution, appointment, assent
-        if prerogative_type not in ["dismiss", "dissolve", "appoint", "refuse_assent", "emergency_powers"]:
+        if prerogative_type not in _VALID_PREROGATIVES:
             raise ValueError(f"Invalid Crown prerogative: {prerogative_type}")
         
-        crown_action = {
-            "prerogative_type": prerogative_type,
-            "justification": justification,
-            "affected_agents": affected_agents,
-            "exercised_by": "overwatch_agent",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "constitutional_authority": "crown"
-        }
+        crown_action = self._build_crown_action(prerogative_type, justification, affected_agents)
         
         # Log constitutional intervention
-        await self.logfire_logger.warning(
-            "Crown prerogative exercised",
-            **crown_action,
-            constitutional_intervention=True
-        )
+        await self.logfire_logger.warning("Crown prerogative exercised", **crown_action)
         
         # Execute prerogative power through Crown protocol
         result = await self.crown_prerogative.exercise_reserve_power(
             prerogative_type, justification, affected_agents
         )
         
-        return {**crown_action, "result": result}
+        crown_action["result"] = result
+        return crown_action
     
-    async def validate_constitutional_decision(
+    @staticmethod
+    def _build_crown_action(
+        prerogative_type: str,
+        justification: str,
+        affected_agents: List[str]
+    ) -> Dict[str, Any]:
+        """Build the record of a Crown prerogative exercise."""
+        return {
+            "prerogative_type": prerogative_type,
+            "justification": justification,
+            "affected_agents": affected_agents,
+            "exercised_by": "overwatch_agent",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "constitutional_authority": "crown",
+            "constitutional_intervention": True
+        }
+    
+    def validate_constitutional_decision(
         self,
         decision: ConstitutionalDecision
-    ) -> Dict[str, Any]:
-        """Validate decision through constitutional framework."""
-        return await self.constitutional_framework.validate_constitutional_decision(decision)
+    ) -> Awaitable[Dict[str, Any]]:
+        """Validate decision through constitutional framework.
+        
+        Returns the framework's coroutine directly rather than wrapping it
+        in another one; callers await the result as before.
+        """
+        return self.constitutional_framework.validate_constitutional_decision(decision)
     
     async def integrate_external_system(
         self, 
@@ -172,19 +466,28 @@ class TriadDeps:
         operation: str, 
         parameters: dict
     ) -> dict:
-        """Universal integration with existing systems via MCP."""
-        with logfire.span("external_system_integration") as span:
-            span.set_attribute("system_type", system_type)
-            span.set_attribute("operation", operation)
-            span.set_attribute("constitutional_oversight", True)
-            
-            result = await self.mcp_client.call_tool(
-                f"{system_type}_adapter",
-                operation,
-                {**parameters, "constitutional_validation": True}
-            )
-            
-            return result
+        """Universal integration with existing systems via MCP.
+        
+        Mutating operations are always traced; other calls are traced for a
+        ``TRACE_SAMPLE_RATE`` fraction of invocations.
+        """
+        call = self.mcp_client.call_tool(
+            f"{system_type}_adapter",
+            operation,
+            {**parameters, "constitutional_validation": True}
+        )
+        
+        if (operation not in _HEAVY_INTEGRATION_OPERATIONS
+                and random.random() >= self.config.TRACE_SAMPLE_RATE):
+            return await call
+        
+        with logfire.span(
+            "external_system_integration",
+            system_type=system_type,
+            operation=operation,
+            constitutional_oversight=True
+        ):
+            return await call
     
     async def initiate_question_period(
         self,
@@ -193,28 +496,47 @@ class TriadDeps:
         questions: List[str]
     ) -> Dict[str, Any]:
         """Initiate Westminster-style Question Period between agents."""
+        timestamp = datetime.now(timezone.utc)
         question_period_data = {
             "questioning_agent": questioning_agent,
             "target_agent": target_agent,
             "questions": questions,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "parliamentary_session": await self.get_current_parliamentary_session()
+            "timestamp": timestamp.isoformat(),
+            "parliamentary_session": self.get_current_parliamentary_session()
         }
         
         # Execute through parliamentary procedure
-        result = await self.parliamentary_procedure.initiate_question_period([
-            {
-                "question": q,
-                "questioning_agent": questioning_agent,
-                "target_agent": target_agent
-            }
-            for q in questions
-        ])
+        result = await self._call_procedure(
+            self.parliamentary_procedure.initiate_question_period,
+            [
+                {
+                    "question": q,
+                    "questioning_agent": questioning_agent,
+                    "target_agent": target_agent
+                }
+                for q in questions
+            ]
+        )
         
-        await self.log_event("question_period_initiated", question_period_data)
+        await self.log_event("question_period_initiated", question_period_data, timestamp)
         
         return result
     
+    async def _call_procedure(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Call a parliamentary procedure method without blocking the event loop.
+        
+        Coroutine methods are awaited directly; synchronous ones run in the
+        shared procedure thread pool.
+        """
+        if inspect.iscoroutinefunction(method):
+            return await method(*args)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_procedure_executor(self.config),
+            functools.partial(method, *args)
+        )
+    
     async def collective_cabinet_decision(
         self,
         proposal: Dict[str, Any],
@@ -241,21 +563,27 @@ class TriadDeps:
                 "violations": validation["violations"]
             }
         
-        # Get positions from all required agents
-        agent_positions = {}
-        for agent in required_agents:
-            # This would typically call the agent's decision method
-            # For now, we'll simulate the process
-            agent_positions[agent] = {
-                "stance": "SUPPORT",  # This would be determined by the agent
-                "reasoning": "Constitutional compliance verified",
-                "prepared_to_resign": False
-            }
+        # Get positions from all required agents concurrently
+        results = await asyncio.gather(
+            *(self._get_agent_position(agent, proposal) for agent in required_agents),
+            return_exceptions=True
+        )
         
-        # Check for collective agreement
-        all_support = all(pos["stance"] == "SUPPORT" for pos in agent_positions.values())
+        # Check for collective agreement while collecting positions
+        agent_positions = {}
+        any_dissent = False
+        for agent, position in zip(required_agents, results, strict=True):
+            if isinstance(position, Exception):
+                position = {
+                    "stance": "UNAVAILABLE",
+                    "reasoning": str(position),
+                    "prepared_to_resign": False
+                }
+            agent_positions[agent] = position
+            if position["stance"] != "SUPPORT":
+                any_dissent = True
         
-        if not all_support:
+        if any_dissent:
             # Trigger collective responsibility crisis
             return await self.constitutional_crisis_manager.handle_collective_responsibility_crisis(
                 proposal, agent_positions
@@ -264,7 +592,7 @@ class TriadDeps:
         await self.log_event("collective_cabinet_decision", {
             "proposal": proposal,
             "agent_positions": agent_positions,
-            "decision_approved": all_support
+            "decision_approved": True
         })
         
         return {
@@ -274,6 +602,16 @@ class TriadDeps:
             "constitutional_compliance": True
         }
     
+    async def _get_agent_position(self, agent: str, proposal: Dict[str, Any]) -> Dict[str, Any]:
+        """Get an agent's position on a cabinet proposal."""
+        # This would typically call the agent's decision method
+        # For now, we'll simulate the process
+        return {
+            "stance": "SUPPORT",  # This would be determined by the agent
+            "reasoning": "Constitutional compliance verified",
+            "prepared_to_resign": False
+        }
+    
     async def close(self):
         """Cleanup resources with constitutional logging."""
         await self.log_event("system_shutdown", {
@@ -281,74 +619,141 @@ class TriadDeps:
             "constitutional_authority": "crown"
         })
         
-        if self.http_client:
-            await self.http_client.aclose()
+        await self.flush()
+        if self._event_bus is not None:
+            self._event_bus.close()
+        if self._record_flusher is not None:
+            self._record_flusher.cancel()
+        if self._record_session is not None:
+            await self._record_session.close()
+        
+        # The shared HTTP client is closed by close_http_client() at app shutdown
         await self.db_session.close()
         await self.a2a_broker.close()
         await self.mcp_client.close()
 
 
+@dataclass(frozen=True, slots=True)
 class TriadConfig:
     """Configuration settings for the Triad constitutional system."""
     
-    def __init__(self):
-        self.DATABASE_URL: str = "postgresql+asyncpg://localhost/triad_constitutional"
-        self.LOGFIRE_TOKEN: str = ""
-        self.A2A_BROKER_URL: str = "redis://localhost:6379"
-        self.MCP_SERVER_URLS: Dict[str, str] = {}
-        self.MODEL_CONFIGS: Dict[str, Any] = {
-            "planner": {"model": "openai:gpt-4o", "temperature": 0.1},
-            "executor": {"model": "openai:gpt-4o", "temperature": 0.0},
-            "evaluator": {"model": "anthropic:claude-3-5-sonnet-latest", "temperature": 0.0},
-            "overwatch": {"model": "openai:gpt-4o", "temperature": 0.1}
-        }
-        self.PERFORMANCE_THRESHOLDS: Dict[str, float] = {
-            "task_timeout_seconds": 300,
-            "max_memory_mb": 1024,
-            "max_cpu_percent": 80.0,
-            "accuracy_threshold": 0.95,
-            "error_rate_threshold": 0.01,
-            "constitutional_compliance_threshold": 0.95
-        }
-        self.INTEGRATION_ADAPTERS: Dict[str, str] = {}
-        
-        # Westminster Constitutional Settings
-        self.PARLIAMENTARY_SESSION_DURATION_HOURS: int = 24 * 30  # 30 days
-        self.QUESTION_PERIOD_MAX_DURATION_MINUTES: int = 60
-        self.COLLECTIVE_RESPONSIBILITY_TIMEOUT_MINUTES: int = 30
-        self.CROWN_INTERVENTION_THRESHOLD: float = 0.80  # Compliance below 80% triggers Crown review
-        
-        # Security and Authentication
-        self.JWT_SECRET_KEY: str = ""
-        self.JWT_ALGORITHM: str = "HS256"
-        self.JWT_EXPIRATION_HOURS: int = 8
-        
-        # External System Integration
-        self.MCP_TIMEOUT_SECONDS: int = 30
-        self.A2A_MESSAGE_TIMEOUT_SECONDS: int = 10
-        self.EXTERNAL_SYSTEM_RETRY_COUNT: int = 3
+    DATABASE_URL: str = "postgresql+asyncpg://localhost/triad_constitutional"
+    LOGFIRE_TOKEN: str = ""
+    A2A_BROKER_URL: str = "redis://localhost:6379"
+    MCP_SERVER_URLS: Dict[str, str] = field(default_factory=dict)
+    MODEL_CONFIGS: Dict[str, Any] = field(default_factory=lambda: {
+        "planner": {"model": "openai:gpt-4o", "temperature": 0.1},
+        "executor": {"model": "openai:gpt-4o", "temperature": 0.0},
+        "evaluator": {"model": "anthropic:claude-3-5-sonnet-latest", "temperature": 0.0},
+        "overwatch": {"model": "openai:gpt-4o", "temperature": 0.1}
+    })
+    PERFORMANCE_THRESHOLDS: Dict[str, float] = field(default_factory=lambda: {
+        "task_timeout_seconds": 300,
+        "max_memory_mb": 1024,
+        "max_cpu_percent": 80.0,
+        "accuracy_threshold": 0.95,
+        "error_rate_threshold": 0.01,
+        "constitutional_compliance_threshold": 0.95
+    })
+    INTEGRATION_ADAPTERS: Dict[str, str] = field(default_factory=dict)
+    
+    # Westminster Constitutional Settings
+    PARLIAMENTARY_SESSION_DURATION_HOURS: int = 24 * 30  # 30 days
+    QUESTION_PERIOD_MAX_DURATION_MINUTES: int = 60
+    COLLECTIVE_RESPONSIBILITY_TIMEOUT_MINUTES: int = 30
+    CROWN_INTERVENTION_THRESHOLD: float = 0.80  # Compliance below 80% triggers Crown review
+    
+    # Security and Authentication
+    JWT_SECRET_KEY: str = ""
+    JWT_ALGORITHM: str = "HS256"
+    JWT_EXPIRATION_HOURS: int = 8
+    
+    # External System Integration
+    MCP_TIMEOUT_SECONDS: int = 30
+    A2A_MESSAGE_TIMEOUT_SECONDS: int = 10
+    EXTERNAL_SYSTEM_RETRY_COUNT: int = 3
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 50
+    TRACE_SAMPLE_RATE: float = 1.0  # Fraction of read-only integrations traced
+    PARLIAMENTARY_EXECUTOR_WORKERS: int = 4  # Threads for synchronous procedures
+    
+    # Database
+    RECORD_ASYNC_COMMIT: bool = False  # opt in to synchronous_commit=off for record batches
+    
+    # Event bus (see TriadDeps.log_event)
+    EVENT_BUS_MAX_SIZE: int = 1024
+    EVENT_BUS_OVERFLOW_POLICY: str = "drop_oldest"  # drop_oldest, drop_newest, block
     
     @classmethod
     def from_environment(cls) -> 'TriadConfig':
         """Load configuration from environment variables."""
         import os
         
-        config = cls()
+        env = os.environ
+        defaults = cls()
         
-        # Override with environment variables
-        config.DATABASE_URL = os.getenv("DATABASE_URL", config.DATABASE_URL)
-        config.LOGFIRE_TOKEN = os.getenv("LOGFIRE_TOKEN", config.LOGFIRE_TOKEN)
-        config.A2A_BROKER_URL = os.getenv("A2A_BROKER_URL", config.A2A_BROKER_URL)
-        config.JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", config.JWT_SECRET_KEY)
-        
-        # MCP Server URLs from environment
-        mcp_urls = os.getenv("MCP_SERVER_URLS", "")
-        if mcp_urls:
-            config.MCP_SERVER_URLS = dict(
-                pair.split("=") for pair in mcp_urls.split(",") if "=" in pair
-            )
+        # MCP Server URLs from environment ("name=url,name=url")
+        mcp_urls = env.get("MCP_SERVER_URLS", "")
         
-        return config
+        # Override with environment variables
+        return replace(
+            defaults,
+            DATABASE_URL=env.get("DATABASE_URL", defaults.DATABASE_URL),
+            LOGFIRE_TOKEN=env.get("LOGFIRE_TOKEN", defaults.LOGFIRE_TOKEN),
+            A2A_BROKER_URL=env.get("A2A_BROKER_URL", defaults.A2A_BROKER_URL),
+            JWT_SECRET_KEY=env.get("JWT_SECRET_KEY", defaults.JWT_SECRET_KEY),
+            MCP_SERVER_URLS=dict(
+                pair.split("=", 1) for pair in mcp_urls.split(",") if "=" in pair
+            ) if mcp_urls else defaults.MCP_SERVER_URLS
+        )
+
+def get_http_client(config: TriadConfig) -> AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+    
+    All TriadDeps instances share one connection pool so keep-alive
+    connections (and their TLS sessions) are reused across requests.
+    """
+    global _http_client
+    
+    if _http_client is None or _http_client.is_closed:
+        _http_client = AsyncClient(
+            limits=Limits(
+                max_connections=config.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            timeout=Timeout(config.MCP_TIMEOUT_SECONDS)
+        )
+    
+    return _http_client
+
+async def close_http_client():
+    """Close the shared HTTP client at application shutdown."""
+    global _http_client
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+def get_procedure_executor(config: TriadConfig) -> ThreadPoolExecutor:
+    """Get the thread pool used for synchronous parliamentary procedures."""
+    global _procedure_executor
+    
+    if _procedure_executor is None:
+        _procedure_executor = ThreadPoolExecutor(
+            max_workers=config.PARLIAMENTARY_EXECUTOR_WORKERS,
+            thread_name_prefix="parliamentary_procedure"
+        )
+    
+    return _procedure_executor
+
+def shutdown_procedure_executor():
+    """Shut down the parliamentary procedure thread pool at application shutdown."""
+    global _procedure_executor
+    
+    if _procedure_executor is not None:
+        _procedure_executor.shutdown(wait=False)
+        _procedure_executor = None
 
 # Dependency injection
 _deps_instance: Optional[TriadDeps] = None
@@ -6,11 +6,10 @@ agent decisions, and democratic accountability data.
 """
 
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, Float, Text, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
-import uuid
 
 
 Base = declarative_base()
@@ -19,10 +18,17 @@ Base = declarative_base()
 class ConstitutionalRecordTable(Base):
     """Parliamentary record table (Hansard equivalent)."""
     __tablename__ = "constitutional_records"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # Session history ordered by time, the primary Hansard query
+        Index("ix_cr_session_ts", "parliamentary_session_id", "timestamp"),
+        # Append-only, time-ordered log: BRIN stays tiny and cheap to maintain
+        Index("ix_cr_ts_brin", "timestamp", postgresql_using="brin"),
+        Index("ix_cr_data_gin", "data", postgresql_using="gin"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     event_type = Column(String(100), nullable=False, index=True)
-    data = Column(JSON, nullable=False)
+    data = Column(JSONB, nullable=False)
     timestamp = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
     constitutional_authority = Column(String(50), nullable=False, index=True)
     parliamentary_session_id = Column(String(100), index=True)
@@ -30,7 +36,7 @@ class ConstitutionalRecordTable(Base):
     
     # Constitutional metadata
     constitutional_compliance = Column(Boolean, default=True)
-    violations = Column(JSON, default=list)
+    violations = Column(JSONB, default=list)
     agent_responsible = Column(String(100), index=True)
 
 
@@ -38,7 +44,7 @@ class ParliamentarySessionTable(Base):
     """Parliamentary sessions table."""
     __tablename__ = "parliamentary_sessions"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     session_id = Column(String(100), unique=True, nullable=False, index=True)
     session_number = Column(Integer, nullable=False)
     start_date = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
@@ -46,13 +52,13 @@ class ParliamentarySessionTable(Base):
     status = Column(String(20), nullable=False, default="active")  # active, prorogued, dissolved
     
     # Government composition
-    government_agents = Column(JSON, default=list)
-    opposition_agents = Column(JSON, default=list)
+    government_agents = Column(JSONB, default=list)
+    opposition_agents = Column(JSONB, default=list)
     
     # Session metadata
     total_decisions = Column(Integer, default=0)
     constitutional_compliance_score = Column(Float, default=1.0)
-    major_decisions = Column(JSON, default=list)
+    major_decisions = Column(JSONB, default=list)
     
     # Relationships
     constitutional_records = relationship("ConstitutionalRecordTable", 
@@ -63,8 +69,11 @@ class ParliamentarySessionTable(Base):
 class WorkflowTable(Base):
     """Workflows created by Planner Agent."""
     __tablename__ = "workflows"
+    __table_args__ = (
+        Index("ix_wf_plan_data_gin", "plan_data", postgresql_using="gin"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     workflow_id = Column(String(100), unique=True, nullable=False, index=True)
     name = Column(String(200), nullable=False)
     description = Column(Text)
@@ -76,9 +85,9 @@ class WorkflowTable(Base):
     completed_at = Column(DateTime(timezone=True))
     
     # Workflow data
-    plan_data = Column(JSON, nullable=False)
-    tasks = Column(JSON, default=list)
-    dependencies = Column(JSON, default=list)
+    plan_data = Column(JSONB, nullable=False)
+    tasks = Column(JSONB, default=list)
+    dependencies = Column(JSONB, default=list)
     
     # Constitutional metadata
     constitutional_authority = Column(String(50), default="legislative")
@@ -88,15 +97,18 @@ class WorkflowTable(Base):
     # Performance metrics
     estimated_duration_minutes = Column(Integer)
     actual_duration_minutes = Column(Integer)
-    resource_requirements = Column(JSON, default=dict)
-    metrics = Column(JSON, default=dict)
+    resource_requirements = Column(JSONB, default=dict)
+    metrics = Column(JSONB, default=dict)
 
 
 class TaskExecutionTable(Base):
     """Task executions by Executor Agent."""
     __tablename__ = "task_executions"
+    __table_args__ = (
+        Index("ix_te_start_time_brin", "start_time", postgresql_using="brin"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     task_id = Column(String(100), unique=True, nullable=False, index=True)
     workflow_id = Column(String(100), nullable=False, index=True)
     
@@ -111,13 +123,13 @@ class TaskExecutionTable(Base):
     execution_time_seconds = Column(Float)
     
     # Task data
-    input_parameters = Column(JSON, default=dict)
-    output_data = Column(JSON, default=dict)
+    input_parameters = Column(JSONB, default=dict)
+    output_data = Column(JSONB, default=dict)
     error_message = Column(Text)
-    logs = Column(JSON, default=list)
+    logs = Column(JSONB, default=list)
     
     # Resource usage
-    resource_usage = Column(JSON, default=dict)
+    resource_usage = Column(JSONB, default=dict)
     cpu_usage_percent = Column(Float)
     memory_usage_mb = Column(Float)
     
@@ -135,7 +147,7 @@ class ValidationReportTable(Base):
     """Validation reports by Evaluator Agent."""
     __tablename__ = "validation_reports"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     report_id = Column(String(100), unique=True, nullable=False, index=True)
     task_execution_id = Column(String(100), nullable=False, index=True)
     workflow_id = Column(String(100), nullable=False, index=True)
@@ -147,15 +159,15 @@ class ValidationReportTable(Base):
     westminster_adherence = Column(Boolean, default=True)
     
     # Detailed validation
-    validation_details = Column(JSON, default=dict)
-    performance_metrics = Column(JSON, default=dict)
-    quality_indicators = Column(JSON, default=dict)
+    validation_details = Column(JSONB, default=dict)
+    performance_metrics = Column(JSONB, default=dict)
+    quality_indicators = Column(JSONB, default=dict)
     
     # Recommendations and findings
-    recommendations = Column(JSON, default=list)
-    passed_validations = Column(JSON, default=list)
-    failed_validations = Column(JSON, default=list)
-    critical_issues = Column(JSON, default=list)
+    recommendations = Column(JSONB, default=list)
+    passed_validations = Column(JSONB, default=list)
+    failed_validations = Column(JSONB, default=list)
+    critical_issues = Column(JSONB, default=list)
     
     # Constitutional metadata
     constitutional_authority = Column(String(50), default="judicial")
@@ -170,7 +182,7 @@ class QuestionPeriodTable(Base):
     """Question Period records for parliamentary accountability."""
     __tablename__ = "question_periods"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     question_period_id = Column(String(100), unique=True, nullable=False, index=True)
     parliamentary_session_id = Column(String(100), nullable=False, index=True)
     
@@ -203,17 +215,17 @@ class NoConfidenceVoteTable(Base):
     """No confidence votes and parliamentary crises."""
     __tablename__ = "no_confidence_votes"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     vote_id = Column(String(100), unique=True, nullable=False, index=True)
     parliamentary_session_id = Column(String(100), nullable=False, index=True)
     
     # Vote details
     target_agent = Column(String(100), nullable=False, index=True)
     initiating_agent = Column(String(100), nullable=False, index=True)
-    reasons = Column(JSON, nullable=False)
+    reasons = Column(JSONB, nullable=False)
     
     # Vote results
-    votes_cast = Column(JSON, default=dict)  # {agent: vote}
+    votes_cast = Column(JSONB, default=dict)  # {agent: vote}
     motion_passed = Column(Boolean)
     confidence_maintained = Column(Boolean)
     
@@ -232,13 +244,13 @@ class CrownInterventionTable(Base):
     """Crown reserve power exercises and constitutional interventions."""
     __tablename__ = "crown_interventions"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     intervention_id = Column(String(100), unique=True, nullable=False, index=True)
     
     # Intervention details
     prerogative_type = Column(String(50), nullable=False)  # dismiss, dissolve, emergency, assent
     constitutional_justification = Column(Text, nullable=False)
-    affected_agents = Column(JSON, default=list)
+    affected_agents = Column(JSONB, default=list)
     
     # Authority and execution
     exercised_by = Column(String(100), default="overwatch_agent")
@@ -248,7 +260,7 @@ class CrownInterventionTable(Base):
     # Results and impact
     intervention_successful = Column(Boolean)
     constitutional_order_restored = Column(Boolean)
-    government_changes = Column(JSON, default=dict)
+    government_changes = Column(JSONB, default=dict)
     
     # Timestamps
     crisis_detected = Column(DateTime(timezone=True))
@@ -263,8 +275,11 @@ class CrownInterventionTable(Base):
 class SystemHealthTable(Base):
     """System health monitoring by Overwatch Agent."""
     __tablename__ = "system_health"
+    __table_args__ = (
+        Index("ix_sh_timestamp_brin", "timestamp", postgresql_using="brin"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     health_check_id = Column(String(100), unique=True, nullable=False, index=True)
     
     # Overall health
@@ -273,14 +288,14 @@ class SystemHealthTable(Base):
     constitutional_compliance_score = Column(Float, nullable=False)
     
     # Component health
-    component_health = Column(JSON, default=dict)
-    agent_statuses = Column(JSON, default=dict)
-    performance_metrics = Column(JSON, default=dict)
+    component_health = Column(JSONB, default=dict)
+    agent_statuses = Column(JSONB, default=dict)
+    performance_metrics = Column(JSONB, default=dict)
     
     # Alerts and issues
-    active_alerts = Column(JSON, default=list)
-    critical_issues = Column(JSON, default=list)
-    recommendations = Column(JSON, default=list)
+    active_alerts = Column(JSONB, default=list)
+    critical_issues = Column(JSONB, default=list)
+    recommendations = Column(JSONB, default=list)
     
     # Parliamentary oversight
     parliamentary_session_id = Column(String(100), index=True)
@@ -296,7 +311,7 @@ class AgentPerformanceTable(Base):
     """Agent performance metrics and constitutional compliance."""
     __tablename__ = "agent_performance"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     agent_name = Column(String(100), nullable=False, index=True)
     constitutional_authority = Column(String(50), nullable=False, index=True)
     
@@ -321,9 +336,9 @@ class AgentPerformanceTable(Base):
     collective_responsibility_compliance = Column(Boolean, default=True)
     
     # Detailed metrics
-    performance_breakdown = Column(JSON, default=dict)
-    improvement_recommendations = Column(JSON, default=list)
-    commendations = Column(JSON, default=list)
+    performance_breakdown = Column(JSONB, default=dict)
+    improvement_recommendations = Column(JSONB, default=list)
+    commendations = Column(JSONB, default=list)
     
     # Constitutional standing
     confidence_level = Column(String(50), default="maintained")  # maintained, questioned, lost